@@ -0,0 +1,252 @@
+"""
+Headless data service for the dashboard.
+
+Serves the same cached Kraken candles and next-day-high predictions as the
+Streamlit pages, as JSON, CSV or Arrow, without running the UI script.
+
+Standalone:   python app/api.py --port 8502
+In-process:   set DATA_API_PORT=8502 before `streamlit run app/main.py`
+              to serve from the dashboard process and share its caches.
+"""
+import sys, os
+import io
+import csv
+import calendar
+import json
+import threading
+import time
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+
+# Allow the API to find the students folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from students.cache import cache_stats
+from students.coin_page import get_coin_history_kraken
+from students.kraken import get_live_candles
+from students.market import get_market_data
+from students.predictions import get_cached_prediction
+from students.registry import list_coins, get_coin, get_predictor
+from students.snapshot import load_snapshot
+from students.warmup import track_prediction
+
+MEDIA_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+COLUMNS = ["date", "open", "high", "low", "close"]
+CHUNK_ROWS = 500
+
+app = FastAPI(title="Crypto Next-Day High Data API")
+
+# Live charts poll /live from the browser (inside the dashboard's component iframe),
+# so only /live answers cross-origin requests; DASHBOARD_ORIGIN narrows it further
+CORS_ORIGINS = [o.strip() for o in os.environ.get("DASHBOARD_ORIGIN", "*").split(",") if o.strip()]
+
+
+class LiveCORSMiddleware:
+    def __init__(self, app):
+        self.app = app
+        self.cors = CORSMiddleware(app, allow_origins=CORS_ORIGINS, allow_methods=["GET"])
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/live/"):
+            await self.cors(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+app.add_middleware(LiveCORSMiddleware)
+
+# Start from the image's snapshot so a fresh container serves data immediately
+load_snapshot()
+
+
+def _get_coin(coin):
+    try:
+        return get_coin(coin)
+    except KeyError:
+        slugs = ", ".join(c["slug"] for c in list_coins())
+        raise HTTPException(status_code=404, detail=f"Unknown coin '{coin}'. Choose from: {slugs}")
+
+
+def _row(candle):
+    return {
+        "date": candle["date"].isoformat(),
+        "open": candle["open"],
+        "high": candle["high"],
+        "low": candle["low"],
+        "close": candle["close"],
+    }
+
+
+# Streaming encoders: each yields the response body in chunks of CHUNK_ROWS rows
+def _stream_json(rows):
+    yield "["
+    for start in range(0, len(rows), CHUNK_ROWS):
+        chunk = ",".join(json.dumps(_row(r)) for r in rows[start:start + CHUNK_ROWS])
+        yield ("," if start else "") + chunk
+    yield "]"
+
+
+def _stream_ndjson(rows):
+    for start in range(0, len(rows), CHUNK_ROWS):
+        yield "".join(json.dumps(_row(r)) + "\n" for r in rows[start:start + CHUNK_ROWS])
+
+
+def _stream_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=COLUMNS)
+    writer.writeheader()
+    for start in range(0, len(rows), CHUNK_ROWS):
+        writer.writerows(_row(r) for r in rows[start:start + CHUNK_ROWS])
+        yield _drain(buffer)
+
+
+def _drain(buffer):
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return data
+
+
+def _stream_arrow(rows):
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise HTTPException(status_code=501, detail="Arrow output requires the 'pyarrow' package.")
+
+    schema = pa.schema([
+        ("date", pa.timestamp("s")),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+    ])
+
+    def generate():
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for start in range(0, len(rows), CHUNK_ROWS):
+                chunk = rows[start:start + CHUNK_ROWS]
+                writer.write_batch(pa.record_batch([[r[c] for r in chunk] for c in COLUMNS], schema=schema))
+                yield _drain(sink)
+        yield _drain(sink)
+
+    return generate()
+
+
+def _stream(rows, fmt):
+    if fmt == "json":
+        return _stream_json(rows)
+    if fmt == "ndjson":
+        return _stream_ndjson(rows)
+    if fmt == "csv":
+        return _stream_csv(rows)
+    return _stream_arrow(rows)
+
+
+@app.get("/coins")
+def coins():
+    return [
+        {"coin": c["slug"], "name": c["name"], "symbol": c["symbol"], "pair": c["kraken_pair"],
+         "coingecko_id": c["coingecko_id"]}
+        for c in list_coins()
+    ]
+
+
+@app.get("/history/{coin}")
+def history(
+    coin: str,
+    days: int = Query(30, ge=1, le=3650),
+    interval: int = Query(1440, ge=1),
+    format: str = Query("json", pattern="^(json|ndjson|csv|arrow)$"),
+):
+    pair = _get_coin(coin)["kraken_pair"]
+    data = get_coin_history_kraken(pair, interval=interval, days=days)
+    if not data:
+        raise HTTPException(status_code=502, detail=f"Unable to load {coin} data from Kraken.")
+
+    rows = sorted(data, key=lambda r: r["date"])
+    # Kraken serves only its newest 720 candles, so without a backfilled store
+    # long ranges start later than requested; report where the data starts
+    requested = int(time.time()) - days * 24 * 60 * 60
+    start = calendar.timegm(rows[0]["date"].timetuple())
+    return StreamingResponse(
+        _stream(rows, format),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f"inline; filename={coin}_{interval}_{days}d.{format}",
+            "X-Data-Start": rows[0]["date"].isoformat(),
+            "X-Data-Truncated": "true" if start > requested + interval * 60 else "false",
+        },
+    )
+
+
+@app.get("/live/{coin}")
+def live(coin: str, interval: int = Query(5, ge=1), since: int = Query(0, ge=0)):
+    """Compact [time, open, high, low, close] rows at or after `since`, for appending to live charts."""
+    pair = _get_coin(coin)["kraken_pair"]
+    try:
+        candles = get_live_candles(pair, interval=interval)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Unable to load {coin} data from Kraken: {e}")
+
+    rows = []
+    for c in candles:
+        ts = calendar.timegm(c["date"].timetuple())
+        if ts >= since:
+            rows.append([ts, c["open"], c["high"], c["low"], c["close"]])
+    return rows
+
+
+@app.get("/predict/{coin}")
+def predict(coin: str, format: str = Query("json", pattern="^(json|csv)$")):
+    prediction = get_cached_prediction(coin, track_prediction(coin, get_predictor(_get_coin(coin))))
+    if not isinstance(prediction, (int, float)):
+        raise HTTPException(status_code=502, detail=str(prediction))
+
+    if format == "csv":
+        return StreamingResponse(iter([f"coin,predicted_next_day_high_usd\n{coin},{prediction}\n"]),
+                                 media_type=MEDIA_TYPES["csv"])
+    return {"coin": coin, "predicted_next_day_high_usd": prediction}
+
+
+@app.get("/market")
+def market():
+    """Latest price and change for every registered coin (one batched upstream request)."""
+    data = get_market_data()
+    if not data:
+        raise HTTPException(status_code=502, detail="Unable to load market data.")
+    return data
+
+
+@app.get("/cache/stats")
+def cache_statistics():
+    return cache_stats()
+
+
+def serve_in_background(port, host="0.0.0.0"):
+    """Run the API on a daemon thread inside the current (dashboard) process."""
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, name="data-api", daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == "__main__":
+    import argparse
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve cached candles and predictions over HTTP.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+
+    uvicorn.run(app, host=args.host, port=args.port)
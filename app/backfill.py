@@ -0,0 +1,154 @@
+"""
+Bulk backfill of Kraken OHLC candles into the local store read by the dashboard.
+
+Pages through Kraken for every (pair, interval) job, running pairs in parallel
+under a shared request-rate budget. Progress is checkpointed per job, so an
+interrupted run resumes where it stopped.
+
+Kraken only serves the newest 720 candles per pair and interval, so a job can
+reach back at most 720 intervals (720 days of daily candles, 30 days of hourly
+ones). Jobs whose range starts earlier are reported as incomplete and the
+run exits non-zero; rerunning on a schedule keeps extending the stored history.
+
+Example:
+    python app/backfill.py --pairs XBTUSD ETHUSD --intervals 1440 240 --days 120
+"""
+import sys, os
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+# Allow the tool to find the students folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from students import store
+from students.kraken import fetch_ohlc
+from students.registry import list_coins
+
+DEFAULT_PAIRS = [coin["kraken_pair"] for coin in list_coins()]
+MAX_RETRIES = 5
+
+
+class RateLimiter:
+    """Token bucket shared by all workers: `rate` requests per second, bursts up to `burst`."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def _fetch_page(session, limiter, pair, interval, since):
+    for attempt in range(MAX_RETRIES):
+        limiter.acquire()
+        try:
+            return fetch_ohlc(pair, interval, since, session=session, timeout=30)
+        except Exception as e:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            # Back off harder when Kraken reports we are over the rate limit
+            delay = 10 * (attempt + 1) if "rate limit" in str(e).lower() else 2 ** attempt
+            print(f"  {pair}/{interval}: {e} - retrying in {delay}s", flush=True)
+            time.sleep(delay)
+
+
+def backfill_job(pair, interval, start, limiter, store_path=None):
+    """
+    Page one (pair, interval) from its checkpoint (or `start`) up to now.
+    Returns (candles written, seconds of history before the oldest stored candle
+    that Kraken could not serve; 0 when the store reaches back to `start`).
+    """
+    since = store.get_checkpoint(pair, interval, path=store_path)
+    since = start if since is None else max(since, start)
+    written = 0
+
+    with requests.Session() as session:
+        while True:
+            rows, last = _fetch_page(session, limiter, pair, interval, since)
+            written += store.save_candles(pair, interval, rows, path=store_path)
+            store.set_checkpoint(pair, interval, last, path=store_path)
+            # `last` stops advancing once we've caught up with the newest committed candle
+            if not rows or last <= since:
+                break
+            since = last
+
+    # Kraken only serves its newest 720 candles, so older ranges stay missing
+    # unless earlier runs already stored them
+    earliest, _ = store.coverage(pair, interval, path=store_path)
+    gap = int(time.time()) - start if earliest is None else max(0, earliest - start - interval * 60)
+    return written, gap
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backfill Kraken OHLC candles into the local store.")
+    parser.add_argument("--pairs", nargs="+", default=DEFAULT_PAIRS, help="Kraken pairs (default: every registered coin)")
+    parser.add_argument("--intervals", nargs="+", type=int, default=[1440],
+                        help="Candle intervals in minutes (1, 5, 15, 30, 60, 240, 1440, 10080, 21600)")
+    parser.add_argument("--days", type=int, default=720, help="How far back to start when no checkpoint exists")
+    parser.add_argument("--workers", type=int, default=4, help="Pairs fetched in parallel")
+    parser.add_argument("--rate", type=float, default=1.0, help="Request budget shared by all workers (req/s)")
+    parser.add_argument("--burst", type=int, default=2, help="Requests allowed in a burst")
+    parser.add_argument("--restart", action="store_true", help="Ignore saved checkpoints")
+    parser.add_argument("--store", default=None, help=f"Store path (default: {store.STORE_PATH})")
+    args = parser.parse_args(argv)
+
+    jobs = [(pair, interval) for pair in args.pairs for interval in args.intervals]
+    if args.restart:
+        for pair, interval in jobs:
+            store.clear_checkpoint(pair, interval, path=args.store)
+
+    start = int(time.time()) - args.days * 24 * 60 * 60
+    limiter = RateLimiter(args.rate, args.burst)
+    total = 0
+    failed = 0
+    incomplete = 0
+    t0 = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(backfill_job, pair, interval, start, limiter, args.store): (pair, interval)
+            for pair, interval in jobs
+        }
+        for future in as_completed(futures):
+            pair, interval = futures[future]
+            try:
+                written, gap = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"{pair}/{interval}: FAILED ({e}) - rerun to resume from checkpoint", flush=True)
+                continue
+            total += written
+            elapsed = time.perf_counter() - t0
+            print(f"{pair}/{interval}: {written} candles ({total / elapsed:,.1f} candles/s overall)", flush=True)
+            if gap:
+                incomplete += 1
+                print(f"{pair}/{interval}: INCOMPLETE - the first {gap / 86400:.1f} of {args.days} days are missing; "
+                      f"Kraken only serves the newest 720 candles ({720 * interval / 1440:g} days at this interval)",
+                      flush=True)
+
+    elapsed = time.perf_counter() - t0
+    print(f"Done: {total} candles from {len(jobs) - failed}/{len(jobs)} jobs "
+          f"in {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.1f} candles/s)"
+          + (f", {incomplete} incomplete" if incomplete else ""))
+    return 1 if failed or incomplete else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+"""
+Concurrent-session load test for the dashboard.
+
+Simulates N Streamlit sessions in one process (so they share caches, as on a
+real server) using streamlit.testing's AppTest. Every outbound HTTP request is
+answered by local stand-ins for Kraken, CoinGecko and the prediction backends,
+and counted per host.
+
+Reports rerun latency percentiles, CPU time per session, process RSS, upstream
+calls and any errors (with the action that hit them) per scenario.
+
+Example:
+    python app/loadtest.py --sessions 1 5 10 --scenario all --upstream-latency 0.2
+"""
+import sys, os
+import argparse
+import json
+import math
+import random
+import resource
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from urllib.parse import urlparse
+
+import requests
+
+# Allow the tool to find the students folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from students import snapshot, store
+from students.cache import cache_stats
+from students.registry import list_coins
+
+MAIN_SCRIPT = os.path.abspath(os.path.join(os.path.dirname(__file__), "main.py"))
+COINS = [coin["name"] for coin in list_coins()]
+DAYS = [7, 30, 60]
+PREDICT_LABEL = "Predict Next-Day High"
+DAYS_LABEL = "Select time range (days):"
+
+# Runs main.py inside the AppTest script thread and records that thread's CPU time
+WRAPPER = f"""
+import runpy, time
+import streamlit as st
+_t0 = time.thread_time()
+try:
+    runpy.run_path({MAIN_SCRIPT!r}, run_name="__main__")
+finally:
+    st.session_state["_loadtest_cpu"] = st.session_state.get("_loadtest_cpu", 0.0) + time.thread_time() - _t0
+"""
+
+
+# Local stand-ins for the external APIs
+class FakeUpstream:
+    BASE_PRICES = {"XBTUSD": 65000.0, "ETHUSD": 3200.0, "XRPUSD": 0.55, "SOLUSD": 150.0}
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = Counter()
+        self.lock = threading.Lock()
+
+    def _response(self, url, payload, status=200):
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(payload).encode()
+        response.headers["Content-Type"] = "application/json"
+        response.url = url
+        return response
+
+    def _price(self, pair, ts):
+        base = self.BASE_PRICES.get(pair, 10.0)
+        return base * (1 + 0.05 * math.sin(ts / 86400 / 5 + len(pair)) + 0.01 * math.cos(ts / 3600))
+
+    def _ohlc(self, params):
+        pair = params["pair"]
+        step = int(params.get("interval", 1440)) * 60
+        now = int(time.time()) // step * step
+        start = max(int(params.get("since", 0)) // step * step, now - 719 * step)
+        rows = []
+        for ts in range(start, now + 1, step):
+            p = self._price(pair, ts)
+            rows.append([ts, f"{p:.6f}", f"{p * 1.02:.6f}", f"{p * 0.98:.6f}", f"{p * 1.01:.6f}",
+                         f"{p:.6f}", "12.5", 42])
+        return {"error": [], "result": {pair: rows, "last": rows[-1][0] if rows else start}}
+
+    def _ticker(self, params):
+        now = time.time()
+        return {"error": [], "result": {
+            pair: {"c": [f"{self._price(pair, now):.6f}", "1"], "o": f"{self._price(pair, now - 86400):.6f}"}
+            for pair in params["pair"].split(",")
+        }}
+
+    def _prices(self, params):
+        return {coin: {"usd": 100.0 + i, "usd_24h_change": 1.5 - i}
+                for i, coin in enumerate(params["ids"].split(","))}
+
+    def _asset_pairs(self, params):
+        return {"error": [], "result": {pair: {"altname": pair} for pair in params["pair"].split(",")}}
+
+    def _prediction(self):
+        # One payload that satisfies every predictor's response parsing
+        return {
+            "predicted_next_day_high_usd": 66000.0,
+            "prediction_summary": {"predicted_next_day_high_usd": 3300.0},
+            "high": "0.58",
+            "predicted_next_day_high": 155.0,
+        }
+
+    def request(self, session, method, url, params=None, **kwargs):
+        host = urlparse(url).netloc
+        with self.lock:
+            self.calls[host] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        params = dict(params or {})
+        if "kraken" in host and url.endswith("/OHLC"):
+            return self._response(url, self._ohlc(params))
+        if "kraken" in host and url.endswith("/Ticker"):
+            return self._response(url, self._ticker(params))
+        if "kraken" in host and url.endswith("/AssetPairs"):
+            return self._response(url, self._asset_pairs(params))
+        if "coingecko" in host:
+            return self._response(url, self._prices(params))
+        if "onrender" in host:
+            return self._response(url, self._prediction())
+        return self._response(url, {"error": "not found"}, status=404)
+
+    def patch(self):
+        upstream = self
+
+        def request(session, method, url, **kwargs):
+            return upstream.request(session, method, url, **kwargs)
+
+        return mock.patch("requests.sessions.Session.request", request)
+
+
+def pin_runtime():
+    """
+    AppTest installs a mock Runtime singleton before each run and clears it
+    afterwards, which breaks sessions running concurrently. Keep serving the
+    most recently installed instance while the load test runs.
+    """
+    from streamlit.runtime import Runtime
+
+    last = {}
+    original = Runtime.instance.__func__
+
+    def instance(cls):
+        if cls._instance is not None:
+            last["runtime"] = cls._instance
+            return cls._instance
+        if "runtime" in last:
+            return last["runtime"]
+        return original(cls)
+
+    def exists(cls):
+        return cls._instance is not None or "runtime" in last
+
+    return mock.patch.multiple(Runtime, instance=classmethod(instance), exists=classmethod(exists))
+
+
+def _rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _button(at, label):
+    return next(b for b in at.button if b.label == label)
+
+
+def _days_selectbox(at):
+    return next(s for s in at.selectbox if s.label == DAYS_LABEL)
+
+
+# Scenarios: each returns the list of (description, action) pairs for one session,
+# where an action is a callable on an AppTest
+def _click(label):
+    return f"click {label}", lambda at: _button(at, label).click()
+
+
+def _select_days(days):
+    return f"select {days} days", lambda at: _days_selectbox(at).select(days)
+
+
+def scenario_browse(rng):
+    return [_click(coin) for coin in rng.sample(COINS, len(COINS))]
+
+
+def scenario_ranges(rng):
+    coin = rng.choice(COINS)
+    return [_click(coin)] + [_select_days(days) for days in rng.sample(DAYS, len(DAYS))]
+
+
+def scenario_predict(rng):
+    actions = []
+    for coin in rng.sample(COINS, len(COINS)):
+        actions.append(_click(coin))
+        actions.append(_click(PREDICT_LABEL))
+    return actions
+
+
+def scenario_mixed(rng):
+    actions = []
+    for _ in range(6):
+        actions.append(_click(rng.choice(COINS)))
+        if rng.random() < 0.5:
+            actions.append(_select_days(rng.choice(DAYS)))
+        if rng.random() < 0.3:
+            actions.append(_click(PREDICT_LABEL))
+    return actions
+
+
+SCENARIOS = {
+    "browse": scenario_browse,
+    "ranges": scenario_ranges,
+    "predict": scenario_predict,
+    "mixed": scenario_mixed,
+}
+
+
+def run_session(index, scenario, seed, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed + index)
+    at = AppTest.from_string(WRAPPER, default_timeout=timeout)
+    latencies = []
+    peak_rss = 0.0
+    errors = []
+
+    for description, action in [("initial load", None)] + SCENARIOS[scenario](rng):
+        try:
+            if action:
+                action(at)
+            t0 = time.perf_counter()
+            at.run()
+            latencies.append(time.perf_counter() - t0)
+            # Exceptions raised by the page script are shown in the app, not raised here
+            for exc in at.exception:
+                errors.append({"session": index, "action": description, "type": "script", "message": exc.message})
+        except Exception as e:
+            errors.append({"session": index, "action": description, "type": type(e).__name__, "message": str(e) or repr(e)})
+        peak_rss = max(peak_rss, _rss_mb())
+
+    return {
+        "latencies": latencies,
+        "cpu_s": at.session_state["_loadtest_cpu"] if "_loadtest_cpu" in at.session_state else 0.0,
+        "peak_rss_mb": peak_rss,
+        "errors": errors,
+    }
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * q / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def reset_caches():
+    from students import cache, predictions
+
+    cache.clear()
+    with predictions._lock:
+        predictions._cache.clear()
+        predictions._finished.clear()
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(store.STORE_PATH + suffix)
+        except OSError:
+            pass
+
+
+def run_scenario(scenario, sessions, upstream, seed, timeout, warm):
+    if not warm:
+        reset_caches()
+    upstream.calls.clear()
+    rss_start = _rss_mb()
+    t0 = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda i: run_session(i, scenario, seed, timeout), range(sessions)))
+
+    wall = time.perf_counter() - t0
+    latencies = [l for r in results for l in r["latencies"]]
+    cpu = [r["cpu_s"] for r in results]
+    return {
+        "scenario": scenario,
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "wall_s": round(wall, 3),
+        "latency_ms": {f"p{q}": round(percentile(latencies, q) * 1000, 1) for q in (50, 90, 95, 99)},
+        "latency_max_ms": round(max(latencies, default=0) * 1000, 1),
+        "cpu_ms_per_session": {
+            "mean": round(sum(cpu) / len(cpu) * 1000, 1),
+            "max": round(max(cpu) * 1000, 1),
+            "sessions": [round(c * 1000, 1) for c in cpu],
+        },
+        # Sessions share one process (and its caches), so memory can only be
+        # measured for the process; growth is averaged over the sessions
+        "rss_mb": {
+            "start": round(rss_start, 1),
+            "peak": round(max(r["peak_rss_mb"] for r in results), 1),
+            "avg_growth_per_session": round((max(r["peak_rss_mb"] for r in results) - rss_start) / sessions, 2),
+        },
+        "errors": sum(len(r["errors"]) for r in results),
+        "error_details": [e for r in results for e in r["errors"]],
+        "cache": {k: v for k, v in cache_stats().items() if k != "functions"},
+        "upstream_calls": dict(upstream.calls),
+        "upstream_calls_total": sum(upstream.calls.values()),
+    }
+
+
+def print_report(report):
+    lat = report["latency_ms"]
+    cpu = report["cpu_ms_per_session"]
+    rss = report["rss_mb"]
+    print(f"\n== {report['scenario']} x {report['sessions']} sessions "
+          f"({report['reruns']} reruns in {report['wall_s']}s, {report['errors']} errors)")
+    print(f"  rerun latency ms  p50 {lat['p50']}  p90 {lat['p90']}  p95 {lat['p95']}  "
+          f"p99 {lat['p99']}  max {report['latency_max_ms']}")
+    print(f"  CPU ms/session    mean {cpu['mean']}  max {cpu['max']}")
+    print(f"  RSS MB            start {rss['start']}  peak {rss['peak']}  "
+          f"avg growth {rss['avg_growth_per_session']}/session (whole process)")
+    cache = report["cache"]
+    print(f"  data cache        {cache['entries']} entries, {cache['used_bytes'] / 1024:.0f} KB "
+          f"({cache['occupancy']:.1%} of budget), {cache['hits']} hits, {cache['misses']} misses, "
+          f"{cache['evictions']} evictions")
+    print(f"  upstream calls    {report['upstream_calls_total']} total")
+    for host, count in sorted(report["upstream_calls"].items()):
+        print(f"    {host:55s} {count}")
+    if report["error_details"]:
+        print("  errors")
+        for error in report["error_details"]:
+            print(f"    session {error['session']}, {error['action']}: {error['type']}: {error['message']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent dashboard sessions against stand-in APIs.")
+    parser.add_argument("--sessions", nargs="+", type=int, default=[1, 5, 10], help="Concurrent session counts")
+    parser.add_argument("--scenario", choices=["all"] + list(SCENARIOS), default="all")
+    parser.add_argument("--upstream-latency", type=float, default=0.05, help="Seconds added to each stand-in API call")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-rerun timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--warm", action="store_true", help="Keep caches between scenarios")
+    parser.add_argument("--json", help="Write the reports to this file")
+    args = parser.parse_args(argv)
+
+    upstream = FakeUpstream(latency=args.upstream_latency)
+    scenarios = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    reports = []
+
+    # Keep the load test away from the real candle store and snapshot; the
+    # temporary directory is removed when the run ends
+    with tempfile.TemporaryDirectory(prefix="loadtest-") as tmp, \
+            mock.patch.object(store, "STORE_PATH", os.path.join(tmp, "candles.sqlite")), \
+            mock.patch.object(snapshot, "SNAPSHOT_PATH", os.path.join(tmp, "missing-snapshot.json.gz")), \
+            upstream.patch(), pin_runtime():
+        for scenario in scenarios:
+            for sessions in args.sessions:
+                report = run_scenario(scenario, sessions, upstream, args.seed, args.timeout, args.warm)
+                print_report(report)
+                reports.append(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(reports, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
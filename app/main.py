@@ -1,21 +1,51 @@
 import streamlit as st
 import sys, os
-import requests
+import time
 
 # Allow Streamlit to find the students folder
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Import crypto pages
-from students.bitcoin import show_bitcoin_page
-from students.ethereum import show_ethereum_page
-from students.xrp import show_xrp_page
-from students.solana import show_solana_page
+# Import crypto pages (coins are listed in students/coins.json)
+from students.registry import list_coins, get_coin
+from students.coin_page import show_coin_page
+from students.comparison import show_comparison_page
+from students.market import peek_market_data
+from students.snapshot import load_snapshot, snapshot_ticker
+from students.profiling import start_profiler, stop_profiler
+from students.warmup import request_warm
 
 # Streamlit setup
 st.set_page_config(page_title="Crypto Next-Day High Dashboard", layout="wide")
 
-# CSS Styling
-st.markdown("""
+# Opt-in profiling of sampled runs (PROFILE_RERUNS); None when off
+profiler = start_profiler()
+profile_tag = "home"
+try:
+    # Seed candles, ticker and predictions from the image's startup snapshot (once per process)
+    @st.cache_resource
+    def load_startup_snapshot():
+        return load_snapshot()
+
+    load_startup_snapshot()
+
+    # Start waking the prediction servers when the app starts (once per process)
+    @st.cache_resource
+    def warm_prediction_backends():
+        request_warm()
+
+    warm_prediction_backends()
+
+    # Optional headless data API, served from this process so it shares the caches
+    @st.cache_resource
+    def start_data_api(port):
+        from api import serve_in_background
+        return serve_in_background(port)
+
+    if os.environ.get("DATA_API_PORT"):
+        start_data_api(int(os.environ["DATA_API_PORT"]))
+
+    # CSS Styling
+    st.markdown("""
 <style>
 header[data-testid="stHeader"] { background: transparent; }
 [data-testid="stToolbar"] { display: none; }
@@ -69,78 +99,83 @@ div[data-testid="stButton"] button:active {
 </style>
 """, unsafe_allow_html=True)
 
-# Live prices ticker
-@st.cache_data(ttl=60)
-def get_crypto_prices():
-    url = "https://api.coingecko.com/api/v3/simple/price"
-    params = {"ids": "bitcoin,ethereum,ripple,solana", "vs_currencies": "usd", "include_24hr_change": "true"}
-    try:
-        data = requests.get(url, params=params, timeout=5).json()
+    # Live prices ticker
+    def format_ticker(market):
         parts = []
-        for coin, info in data.items():
-            symbol = {"bitcoin": "BTC", "ethereum": "ETH", "ripple": "XRP", "solana": "SOL"}[coin]
-            price = info.get("usd", 0)
-            change = info.get("usd_24h_change", 0)
+        for coin in list_coins():
+            info = market.get(coin["slug"])
+            if not info:
+                continue
+            price = info.get("price", 0)
+            change = info.get("change", 0)
             arrow = "▲" if change >= 0 else "▼"
             color = "#2D9F4F" if change >= 0 else "#D9534F"
             parts.append(
-                f"<span style='color:#2C2C2C;font-weight:600'>{symbol}/USD</span> "
+                f"<span style='color:#2C2C2C;font-weight:600'>{coin['symbol']}/USD</span> "
                 f"<span style='color:#5A5A5A'>{price:,.2f}</span> "
                 f"<span style='color:{color};font-weight:600'>{arrow}{abs(change):.2f}%</span>"
             )
         return "  ".join(parts)
-    except Exception:
-        return "BTC/USD 67,450 ▲1.25% ETH/USD 3,120 ▲0.84% XRP/USD 0.512 ▼0.34% SOL/USD 102.4 ▲2.02%"
 
-# Show ticker
-prices_html = get_crypto_prices()
-st.markdown(f"<div class='ticker'><span>{prices_html}</span></div>", unsafe_allow_html=True)
+    def get_crypto_prices():
+        # One batched request for all registered coins (cached for 60 s)
+        market = peek_market_data()
+        if market:
+            return format_ticker(market)
+        # Else the values baked into the image, marked with when they were captured
+        baked = snapshot_ticker()
+        if baked:
+            market, created = baked
+            as_of = time.strftime('%Y-%m-%d %H:%M', time.gmtime(created))
+            return format_ticker(market) + f"  <span style='color:#8B7355'>(as of {as_of} UTC)</span>"
+        return "<span style='color:#8B7355'>Live prices are currently unavailable</span>"
 
-# Title
-st.title("Crypto Next-Day High Price Prediction Dashboard")
+    # Show ticker
+    prices_html = get_crypto_prices()
+    st.markdown(f"<div class='ticker'><span>{prices_html}</span></div>", unsafe_allow_html=True)
 
-# Button Navigation 
-st.markdown("### Select Cryptocurrency")
+    # Title
+    st.title("Crypto Next-Day High Price Prediction Dashboard")
 
-col1, col2, col3, col4 = st.columns(4)
+    # Button Navigation 
+    st.markdown("### Select Cryptocurrency")
 
-if "selected_coin" not in st.session_state:
-    st.session_state.selected_coin = None
+    if "selected_coin" not in st.session_state:
+        st.session_state.selected_coin = None
 
-with col1:
-    if st.button("Bitcoin", use_container_width=True):
-        st.session_state.selected_coin = "Bitcoin"
-with col2:
-    if st.button("Ethereum", use_container_width=True):
-        st.session_state.selected_coin = "Ethereum"
-with col3:
-    if st.button("XRP", use_container_width=True):
-        st.session_state.selected_coin = "XRP"
-with col4:
-    if st.button("Solana", use_container_width=True):
-        st.session_state.selected_coin = "Solana"
+    # One button per registered coin plus Compare, NAV_COLUMNS to a row
+    NAV_COLUMNS = 5
+    nav_items = [(coin["name"], coin["slug"]) for coin in list_coins()] + [("Compare", "compare")]
+    for start in range(0, len(nav_items), NAV_COLUMNS):
+        for col, (label, slug) in zip(st.columns(NAV_COLUMNS), nav_items[start:start + NAV_COLUMNS]):
+            with col:
+                if st.button(label, use_container_width=True, key=f"nav_{slug}"):
+                    st.session_state.selected_coin = slug
 
-st.markdown("---")
+    st.markdown("---")
 
-try:
-    if st.session_state.selected_coin == "Bitcoin":
-        show_bitcoin_page()
-    elif st.session_state.selected_coin == "Ethereum":
-        show_ethereum_page()
-    elif st.session_state.selected_coin == "XRP":
-        show_xrp_page()
-    elif st.session_state.selected_coin == "Solana":
-        show_solana_page()
-    else:
-        st.markdown("<p style='text-align:center;color:#777;'>Please select a cryptocurrency above to view predictions and charts.</p>", unsafe_allow_html=True)
-except Exception as e:
-    st.error(f"Error loading {st.session_state.selected_coin} page: {e}")
-
-# Footer
-st.markdown("---")
-st.markdown("""
+    profile_tag = st.session_state.selected_coin or "home"
+    try:
+        if st.session_state.selected_coin == "compare":
+            show_comparison_page()
+        elif st.session_state.selected_coin:
+            show_coin_page(get_coin(st.session_state.selected_coin))
+        else:
+            st.markdown("<p style='text-align:center;color:#777;'>Please select a cryptocurrency above to view predictions and charts.</p>", unsafe_allow_html=True)
+    except Exception as e:
+        st.error(f"Error loading {st.session_state.selected_coin} page: {e}")
+
+    # Footer
+    st.markdown("---")
+    st.markdown("""
 <div style='text-align: center; color: #8B7355; padding: 1rem; font-size: 13px;'>
     <p>Data Sources: <strong>CoinGecko API</strong> & <strong>Kraken API</strong> | Group 8 Project AT3</p>
     <p><em>⚠️ This tool is developed solely for academic purposes and should not be used for financial or investment decisions.</em></p>
 </div>
 """, unsafe_allow_html=True)
+
+finally:
+    # Also runs when a click interrupts the script (RerunException is a BaseException),
+    # so slow interrupted runs are saved and their sampler stopped. No Streamlit calls
+    # here: once a run is interrupted they raise again.
+    stop_profiler(profiler, profile_tag)
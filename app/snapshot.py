@@ -0,0 +1,96 @@
+"""
+Build the startup snapshot baked into the Docker image.
+
+Captures recent Kraken candles, the market ticker and the latest predictions
+into a small gzipped JSON file that the app loads at startup (students/snapshot.py).
+Every part is optional: whatever can't be fetched is left out.
+
+Example:
+    python app/snapshot.py --days 60
+"""
+import sys, os
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Allow the tool to find the students folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from students.kraken import fetch_ohlc
+from students.market import get_market_data
+from students.registry import list_coins, get_predictor
+from students.snapshot import SNAPSHOT_PATH, write_snapshot
+
+
+def fetch_candles(pairs, interval, days):
+    since = int(time.time()) - days * 24 * 60 * 60
+    candles = {}
+    for pair in pairs:
+        try:
+            rows, _ = fetch_ohlc(pair, interval, since)
+        except Exception as e:
+            print(f"  {pair}: skipped ({e})")
+            continue
+        # Drop the trade count and store numbers rather than Kraken's strings
+        candles[pair] = {str(interval): [[int(r[0])] + [float(v) for v in r[1:7]] for r in rows]}
+        print(f"  {pair}: {len(rows)} candles")
+    return candles
+
+
+def fetch_ticker():
+    # Same batched market data as the ticker in app/main.py
+    market = get_market_data()
+    if not market:
+        print("  ticker: skipped (no market data)")
+    else:
+        print(f"  {len(market)} coins")
+    return market
+
+
+def fetch_predictions(timeout):
+    # Prediction backends may be cold-starting, so query them in parallel
+    predictions = {}
+    coins = list_coins()
+    pool = ThreadPoolExecutor(max_workers=len(coins))
+    futures = {pool.submit(get_predictor(coin)): coin["slug"] for coin in coins}
+    done, _ = wait(futures, timeout=timeout)
+    for future in done:
+        value = future.result()
+        if isinstance(value, (int, float)):
+            predictions[futures[future]] = [time.time(), value]
+            print(f"  {futures[future]}: {value}")
+        else:
+            print(f"  {futures[future]}: skipped ({value})")
+    pool.shutdown(wait=False, cancel_futures=True)
+    return predictions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the startup data snapshot.")
+    parser.add_argument("--days", type=int, default=60, help="Days of candles to include")
+    parser.add_argument("--interval", type=int, default=1440, help="Candle interval in minutes")
+    parser.add_argument("--skip-predictions", action="store_true")
+    parser.add_argument("--prediction-timeout", type=float, default=150.0)
+    parser.add_argument("--output", default=SNAPSHOT_PATH)
+    args = parser.parse_args(argv)
+
+    print("Candles:")
+    snapshot = {"created": int(time.time()), "candles": fetch_candles([c["kraken_pair"] for c in list_coins()], args.interval, args.days)}
+    print("Ticker:")
+    ticker = fetch_ticker()
+    if ticker:
+        snapshot["ticker"] = ticker
+    if not args.skip_predictions:
+        print("Predictions:")
+        snapshot["predictions"] = fetch_predictions(args.prediction_timeout)
+
+    write_snapshot(snapshot, args.output)
+    print(f"Wrote {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+    return 0 if snapshot["candles"] else 1
+
+
+if __name__ == "__main__":
+    code = main()
+    sys.stdout.flush()
+    # Exit without waiting on prediction calls that are still hanging
+    os._exit(code)
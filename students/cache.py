@@ -0,0 +1,209 @@
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+# Process-wide data cache with one memory budget shared by every cached function.
+# Least recently used entries are evicted once the measured total exceeds it.
+CACHE_BUDGET_MB = float(os.environ.get("CACHE_BUDGET_MB", 64))
+
+_entries = OrderedDict()  # key -> (value or pickled bytes, size_bytes, expires_at, pickled)
+_key_locks = {}
+_lock = threading.RLock()
+_budget = int(CACHE_BUDGET_MB * 1024 * 1024)
+_total = 0
+_stats = {}  # function name -> counters
+
+
+def set_budget(mb):
+    """Change the memory budget (in MB) and evict down to it."""
+    global _budget
+    with _lock:
+        _budget = int(mb * 1024 * 1024)
+        _evict()
+
+
+def measure(obj):
+    """Approximate in-memory size of `obj` in bytes, following containers."""
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if hasattr(item, "memory_usage") and hasattr(item, "columns"):  # pandas DataFrame
+            size += int(item.memory_usage(deep=True).sum())
+            continue
+        if hasattr(item, "to_plotly_json"):  # plotly Figure
+            size += len(pickle.dumps(item.to_plotly_json(), pickle.HIGHEST_PROTOCOL))
+            continue
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
+def _function_stats(name):
+    if name not in _stats:
+        _stats[name] = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "entries": 0, "bytes": 0}
+    return _stats[name]
+
+
+def _remove(key):
+    global _total
+    _, size, _, _ = _entries.pop(key)
+    _total -= size
+    stats = _function_stats(key[0])
+    stats["entries"] -= 1
+    stats["bytes"] -= size
+
+
+def _evict():
+    # Expired entries go first, then least recently used ones
+    now = time.time()
+    for key in [k for k, (_, _, expires, _) in _entries.items() if expires is not None and expires <= now]:
+        _remove(key)
+        _function_stats(key[0])["expirations"] += 1
+    while _total > _budget and _entries:
+        key = next(iter(_entries))
+        _remove(key)
+        _function_stats(key[0])["evictions"] += 1
+
+
+def _lookup(key):
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            return False, None
+        value, _, expires, pickled = entry
+        if expires is not None and expires <= time.time():
+            _remove(key)
+            _function_stats(key[0])["expirations"] += 1
+            return False, None
+        _entries.move_to_end(key)
+        _function_stats(key[0])["hits"] += 1
+    # Unpickle outside the lock; every hit gets its own copy
+    return True, pickle.loads(value) if pickled else value
+
+
+def _store(key, value, ttl, copy):
+    global _total
+    if copy:
+        try:
+            value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            raise TypeError(f"{key[0]} returned an unpicklable value; use @cached(copy=False) to share it") from e
+        size = sys.getsizeof(value)
+    else:
+        size = measure(value)
+    with _lock:
+        if key in _entries:
+            _remove(key)
+        # An entry larger than the whole budget is returned but never stored
+        if size > _budget:
+            return
+        _entries[key] = (value, size, time.time() + ttl if ttl else None, copy)
+        _total += size
+        stats = _function_stats(key[0])
+        stats["entries"] += 1
+        stats["bytes"] += size
+        _evict()
+
+
+def _freeze(name, value):
+    """Hashable stand-in for an argument value; unhashable ones are keyed by their pickled digest."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+    try:
+        digest = hashlib.sha256(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)).hexdigest()
+    except Exception as e:
+        raise TypeError(f"Cannot cache on argument '{name}' of type {type(value).__name__}: "
+                        "it is neither hashable nor picklable") from e
+    return (type(value).__qualname__, digest)
+
+
+def cached(ttl=None, copy=True, keep=None):
+    """
+    Cache a function's results in the shared budgeted cache.
+
+    Replaces @st.cache_data: arguments are bound to the signature (so positional
+    and keyword calls share entries), unhashable arguments (lists, dicts,
+    DataFrames) are keyed by a digest of their pickled form, results expire
+    after `ttl` seconds, and concurrent misses for the same arguments run the
+    function once. Like st.cache_data, results are stored pickled and every
+    caller gets its own copy; with copy=False the cached object itself is
+    shared and callers must not mutate it. None results (failed fetches) are
+    not cached, nor are results for which `keep(result)` is false.
+    """
+    def decorator(fn):
+        name = f"{fn.__module__}.{fn.__qualname__}"
+        signature = inspect.signature(fn)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name, tuple((arg, _freeze(arg, value)) for arg, value in bound.arguments.items()))
+
+            hit, value = _lookup(key)
+            if hit:
+                return value
+            with _lock:
+                key_lock = _key_locks.setdefault(key, threading.Lock())
+            try:
+                with key_lock:
+                    hit, value = _lookup(key)
+                    if hit:
+                        return value
+                    with _lock:
+                        _function_stats(name)["misses"] += 1
+                    value = fn(*args, **kwargs)
+                    if value is not None and (keep is None or keep(value)):
+                        _store(key, value, ttl, copy)
+            finally:
+                with _lock:
+                    if _key_locks.get(key) is key_lock:
+                        del _key_locks[key]
+            return value
+
+        wrapper.clear = lambda: clear(name)
+        return wrapper
+
+    return decorator
+
+
+def clear(name=None):
+    """Drop all cached entries, or only those of the function called `name`."""
+    with _lock:
+        for key in [k for k in _entries if name is None or k[0] == name]:
+            _remove(key)
+
+
+def cache_stats():
+    """Occupancy and eviction statistics, overall and per cached function."""
+    with _lock:
+        functions = {name: dict(stats) for name, stats in _stats.items()}
+        return {
+            "budget_bytes": _budget,
+            "used_bytes": _total,
+            "occupancy": round(_total / _budget, 4) if _budget else 0.0,
+            "entries": len(_entries),
+            "hits": sum(s["hits"] for s in functions.values()),
+            "misses": sum(s["misses"] for s in functions.values()),
+            "evictions": sum(s["evictions"] for s in functions.values()),
+            "expirations": sum(s["expirations"] for s in functions.values()),
+            "functions": functions,
+        }
@@ -0,0 +1,163 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from students.cache import cached
+from students.kraken import get_history, is_stale
+from students.live_chart import show_live_section
+from students.predictions import get_cached_prediction, describe_last_prediction
+from students.registry import get_predictor
+from students.warmup import request_warm, backend_status, track_prediction
+
+STATUS_REFRESH = 5  # seconds between readiness caption updates
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+# Fetch OHLC data (default = 30 days). Stored candles served while Kraken is
+# slow are not cached, so the next run picks up the background top-up
+@cached(ttl=300, keep=lambda data: not is_stale(data))
+def get_coin_history_kraken(pair, interval=1440, days=30):
+    """
+    Fetch historical OHLC data from Kraken for the given trading pair.
+    interval=1440 means daily candles (1-day interval).
+    Candles are read from the local store and topped up incrementally.
+    Returns None when the data can't be loaded; callers show the error, so the
+    data API can share the cache entries without a Streamlit context.
+    """
+    try:
+        return get_history(pair, interval=interval, days=days)
+    except Exception:
+        return None
+
+
+def show_stale_caption(data, name):
+    """Note under a chart drawn from stored (e.g. snapshot) candles while Kraken catches up."""
+    if is_stale(data):
+        as_of = data[-1]["date"].strftime("%Y-%m-%d %H:%M")
+        st.caption(f"⏳ {name} candles as of {as_of} UTC - newer candles are still loading from Kraken.")
+
+
+# Plotly Candlestick Chart
+def plot_candlestick(data, symbol, days):
+    if not data:
+        return None
+
+    df = pd.DataFrame(data).sort_values("date")
+    df["date_str"] = df["date"].dt.strftime("%b %d")
+
+    # Show every day for 7-day, every 3 days for longer
+    dtick_val = 1 if days == 7 else 3
+
+    # Using default hover text (no custom hovertemplate)
+    fig = go.Figure(
+        data=[
+            go.Candlestick(
+                x=df["date_str"],
+                open=df["open"],
+                high=df["high"],
+                low=df["low"],
+                close=df["close"],
+                increasing_line_color="#4CAF50",
+                decreasing_line_color="#EF5350",
+                whiskerwidth=0.7,
+                opacity=1
+            )
+        ]
+    )
+
+    fig.update_layout(
+        title=f"{symbol} {days}-Day Candlestick Chart",
+        xaxis_title="Date",
+        yaxis_title="Price (USD)",
+        template="plotly_white",
+        height=400,
+        margin=dict(l=20, r=20, t=40, b=20),
+        paper_bgcolor="#FAF8F3",
+        plot_bgcolor="#FFFFFF",
+        font=dict(color="#3A3A3A", size=10),
+        xaxis=dict(
+            type="category",
+            gridcolor="rgba(0,0,0,0.08)",
+            rangeslider=dict(visible=False),
+            showline=True,
+            linecolor="rgba(0,0,0,0.1)",
+            tickmode="linear",
+            tick0=0,
+            dtick=dtick_val
+        ),
+        yaxis=dict(
+            gridcolor="rgba(0,0,0,0.08)",
+            showline=True,
+            linecolor="rgba(0,0,0,0.1)",
+            tickprefix="$"
+        ),
+        hovermode="x unified",
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_color="#333",
+            bordercolor="rgba(0,0,0,0.1)"
+        ),
+        showlegend=False
+    )
+
+    fig.update_traces(
+        selector=dict(type="candlestick"),
+        increasing_line_width=2.0,
+        decreasing_line_width=2.0
+    )
+
+    return fig
+
+
+def show_backend_status(slug):
+    st.caption(backend_status(slug))
+
+
+# Rerun the readiness caption on its own every few seconds (without rerunning the
+# page) so "waking up" counts down and turns ready when the server answers
+if _fragment is not None:
+    show_backend_status = _fragment(run_every=STATUS_REFRESH)(show_backend_status)
+
+
+# Streamlit Page Layout, shared by every coin in the registry
+def show_coin_page(coin):
+    slug = coin["slug"]
+    st.image(coin["icon"], width=50)
+    st.header(f"{coin['name']} Next-Day High Price Prediction")
+
+    # Start waking the model server as soon as the page opens
+    request_warm(slug)
+    predict_col, status_col = st.columns([1, 3])
+    with predict_col:
+        predict_clicked = st.button("Predict Next-Day High", key=f"predict_{slug}_btn")
+    with status_col:
+        show_backend_status(slug)
+
+    if predict_clicked:
+        with st.spinner("Fetching prediction..."):
+            prediction = get_cached_prediction(slug, track_prediction(slug, get_predictor(coin)))
+            if isinstance(prediction, (int, float)):
+                st.success(f"📈 Predicted Next-Day High: **${prediction:,.2f} USD**")
+            else:
+                st.warning(f"⚠️ {prediction}")
+                if "rate limit" in str(prediction).lower():
+                    st.info(f"💡 The {coin['name']} API is currently rate-limited. Please wait a few minutes and try again.")
+                fallback = describe_last_prediction(slug)
+                if fallback:
+                    st.caption(fallback)
+
+    # Live intraday chart, updated in the browser without rerunning the page
+    if st.toggle("Live updates", key=f"{slug}_live"):
+        show_live_section(slug, coin["kraken_pair"], coin["chart_name"], get_coin_history_kraken, key=slug)
+        return
+
+    # Default = 30 days
+    days = st.selectbox("Select time range (days):", [7, 30, 60], index=1, key=f"{slug}_days")
+    data = get_coin_history_kraken(coin["kraken_pair"], interval=1440, days=days)
+
+    if data:
+        fig = plot_candlestick(data, coin["chart_name"], days)
+        st.plotly_chart(fig, use_container_width=True)
+        show_stale_caption(data, coin["chart_name"])
+    else:
+        st.error(f"Unable to load {coin['chart_name']} data.")
@@ -0,0 +1,157 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+# Reuse the coin pages' cached Kraken fetch so this page adds no extra upstream calls
+from students.coin_page import get_coin_history_kraken, show_stale_caption
+from students.registry import list_coins
+
+DEFAULT_COINS = 4
+
+
+# Align the cached histories of the selected coins on a shared timestamp index
+def load_aligned_closes(coins, days):
+    series = {}
+    for coin in coins:
+        # Same arguments as the coin pages so the cache entries are shared
+        data = get_coin_history_kraken(coin["kraken_pair"], interval=1440, days=days)
+        if not data:
+            st.warning(f"Unable to load {coin['name']} data; comparing the other coins.")
+            continue
+        show_stale_caption(data, coin["name"])
+        df = pd.DataFrame(data)
+        series[coin["symbol"]] = df.set_index("date")["close"]
+
+    if len(series) < 2:
+        return None
+    closes = pd.concat(series, axis=1, join="inner").sort_index()
+    return closes if len(closes) > 1 else None
+
+
+def compute_comparison(closes, window):
+    """
+    Compute normalized prices, the return correlation matrix and rolling
+    correlations for every coin pair in one vectorized pass over the
+    stacked (time x coin) close array.
+    """
+    prices = closes.to_numpy(dtype=float)
+    normalized = prices / prices[0] * 100.0
+
+    returns = np.diff(np.log(prices), axis=0)  # (T, N)
+    with np.errstate(divide="ignore", invalid="ignore"):  # constant prices give NaN
+        corr = np.corrcoef(returns, rowvar=False)
+
+    # Rolling sums of r_i and r_i * r_j for all pairs at once via cumulative sums
+    zero = np.zeros((1,) + returns.shape[1:])
+    cs = np.concatenate([zero, np.cumsum(returns, axis=0)])
+    products = returns[:, :, None] * returns[:, None, :]  # (T, N, N)
+    cs_products = np.concatenate([zero[:, :, None] * zero[:, None, :], np.cumsum(products, axis=0)])
+
+    mean = (cs[window:] - cs[:-window]) / window  # (T-w+1, N)
+    mean_products = (cs_products[window:] - cs_products[:-window]) / window  # (T-w+1, N, N)
+    cov = mean_products - mean[:, :, None] * mean[:, None, :]
+    var = np.clip(np.diagonal(cov, axis1=1, axis2=2), 0, None)  # (T-w+1, N)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rolling = cov / np.sqrt(var[:, :, None] * var[:, None, :])
+
+    symbols = list(closes.columns)
+    i, j = np.triu_indices(len(symbols), k=1)
+    rolling_df = pd.DataFrame(
+        rolling[:, i, j],
+        index=closes.index[window:],
+        columns=[f"{symbols[a]}/{symbols[b]}" for a, b in zip(i, j)],
+    )
+
+    return (
+        pd.DataFrame(normalized, index=closes.index, columns=symbols),
+        pd.DataFrame(corr, index=symbols, columns=symbols),
+        rolling_df,
+    )
+
+
+def _style(fig, title, yaxis_title, height=400):
+    fig.update_layout(
+        title=title,
+        yaxis_title=yaxis_title,
+        template="plotly_white",
+        height=height,
+        margin=dict(l=20, r=20, t=40, b=20),
+        paper_bgcolor="#FAF8F3",
+        plot_bgcolor="#FFFFFF",
+        font=dict(color="#3A3A3A", size=10),
+        xaxis=dict(gridcolor="rgba(0,0,0,0.08)", showline=True, linecolor="rgba(0,0,0,0.1)"),
+        yaxis=dict(gridcolor="rgba(0,0,0,0.08)", showline=True, linecolor="rgba(0,0,0,0.1)"),
+        hovermode="x unified",
+    )
+    return fig
+
+
+def plot_normalized(normalized, days):
+    colors = {coin["symbol"]: coin["color"] for coin in list_coins()}
+    fig = go.Figure([
+        go.Scatter(x=normalized.index, y=normalized[symbol], mode="lines", name=symbol,
+                   line=dict(color=colors.get(symbol), width=2))
+        for symbol in normalized.columns
+    ])
+    return _style(fig, f"Normalized Price ({days} Days, start = 100)", "Index")
+
+
+def plot_correlation_matrix(corr):
+    fig = go.Figure(
+        go.Heatmap(
+            z=corr.values,
+            x=corr.columns,
+            y=corr.index,
+            zmin=-1,
+            zmax=1,
+            colorscale="RdBu",
+            text=np.round(corr.values, 2),
+            texttemplate="%{text}",
+        )
+    )
+    fig = _style(fig, "Daily Return Correlation", "", height=360)
+    fig.update_layout(hovermode="closest", yaxis=dict(autorange="reversed"))
+    return fig
+
+
+def plot_rolling_correlations(rolling, window):
+    fig = go.Figure([
+        go.Scatter(x=rolling.index, y=rolling[name], mode="lines", name=name)
+        for name in rolling.columns
+    ])
+    fig = _style(fig, f"{window}-Day Rolling Return Correlation", "Correlation", height=360)
+    fig.update_layout(yaxis=dict(range=[-1, 1]))
+    return fig
+
+
+# Streamlit Page Layout
+def show_comparison_page():
+    st.header("Multi-Coin Comparison")
+
+    coins = list_coins()
+    names = [coin["name"] for coin in coins]
+    selected = st.multiselect("Coins:", names, default=names[:DEFAULT_COINS], key="compare_coins")
+    if len(selected) < 2:
+        st.info("Select at least two coins to compare.")
+        return
+
+    days = st.selectbox("Select time range (days):", [7, 30, 60], index=1, key="compare_days")
+    closes = load_aligned_closes([coin for coin in coins if coin["name"] in selected], days)
+    if closes is None:
+        st.error("Unable to load comparison data.")
+        return
+
+    # Rolling window must leave at least one full window of returns
+    windows = [w for w in [3, 5, 7, 14] if w < len(closes) - 1] or [2]
+    window = st.selectbox("Rolling correlation window (days):", windows,
+                          index=min(2, len(windows) - 1), key="compare_window")
+
+    normalized, corr, rolling = compute_comparison(closes, window)
+
+    st.plotly_chart(plot_normalized(normalized, days), use_container_width=True)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(plot_correlation_matrix(corr), use_container_width=True)
+    with col2:
+        st.plotly_chart(plot_rolling_correlations(rolling, window), use_container_width=True)
@@ -0,0 +1,136 @@
+import calendar
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import requests
+
+from students import store
+from students.cache import cached
+
+OHLC_URL = "https://api.kraken.com/0/public/OHLC"
+LIVE_TTL = 10  # seconds
+MAX_CANDLES = 720  # per OHLC call; Kraken serves no older candles than the newest 720
+TOPUP_WAIT = 1.0  # seconds a request the store covers waits for Kraken before serving stored candles
+
+_topups = {}  # (pair, interval) -> thread topping up the store
+_topups_lock = threading.Lock()
+
+
+def fetch_ohlc(pair, interval=1440, since=0, session=None, timeout=10):
+    """
+    Fetch one page of raw OHLC rows from Kraken.
+    Kraken returns at most MAX_CANDLES candles per call plus a `last` id to page from.
+    """
+    params = {"pair": pair, "interval": interval, "since": int(since)}
+    response = (session or requests).get(OHLC_URL, params=params, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+    if data.get("error"):
+        raise RuntimeError(", ".join(data["error"]))
+
+    # Kraken returns nested dict with pair key (plus "last")
+    result = data["result"]
+    key = next(k for k in result if k != "last")
+    return result[key], int(result.get("last", since))
+
+
+def to_candles(rows):
+    return [
+        {
+            "date": datetime.utcfromtimestamp(ts),
+            "open": float(o),
+            "high": float(h),
+            "low": float(l),
+            "close": float(c)
+        }
+        for ts, o, h, l, c, *_ in rows
+    ]
+
+
+def _top_up(pair, interval, since):
+    try:
+        rows, _ = fetch_ohlc(pair, interval, since)
+        store.save_candles(pair, interval, rows)
+    except Exception:
+        pass  # keep the stored candles; the next request tries again
+
+
+def _start_top_up(pair, interval, since):
+    """Fetch newer candles into the store in the background, one fetch per pair and interval at a time."""
+    with _topups_lock:
+        thread = _topups.get((pair, interval))
+        if thread is None or not thread.is_alive():
+            thread = threading.Thread(target=_top_up, args=(pair, interval, since), daemon=True)
+            _topups[(pair, interval)] = thread
+            thread.start()
+    return thread
+
+
+def get_history(pair, interval=1440, days=30):
+    """
+    Return `days` of candles for `pair`, read from the local store and topped
+    up incrementally from Kraken. When the store covers the range, Kraken gets
+    TOPUP_WAIT seconds before the stored candles are served as they are (see
+    is_stale). Falls back to a plain Kraken request when the store is
+    unavailable, and to stored candles when Kraken is unavailable.
+    """
+    now = int(time.time())
+    start_time = now - int(days * 24 * 60 * 60)  # seconds
+    # Older candles than Kraken's newest MAX_CANDLES can only come from a backfilled store
+    reachable = max(start_time, now - (MAX_CANDLES - 1) * interval * 60)
+
+    try:
+        earliest, latest = store.coverage(pair, interval)
+    except (sqlite3.Error, OSError):
+        return to_candles(fetch_ohlc(pair, interval, start_time)[0])
+
+    covered = latest is not None and earliest <= reachable + interval * 60 and latest >= start_time
+    if covered:
+        # Only request what the store is missing, re-requesting the newest stored
+        # candle too since it was still forming
+        _start_top_up(pair, interval, latest - interval * 60).join(TOPUP_WAIT)
+        try:
+            return store.load_candles(pair, interval, start_time - interval * 60 + 1)
+        except (sqlite3.Error, OSError):
+            pass
+
+    try:
+        rows, _ = fetch_ohlc(pair, interval, start_time)
+    except Exception:
+        if latest is None or latest < start_time:
+            raise
+        rows = []
+
+    try:
+        store.save_candles(pair, interval, rows)
+        return store.load_candles(pair, interval, start_time - interval * 60 + 1)
+    except (sqlite3.Error, OSError):
+        return to_candles(rows)
+
+
+def is_stale(candles):
+    """
+    True when at least one completed candle is missing after the newest one,
+    i.e. the candles came from the store (or snapshot) while Kraken was slow.
+    """
+    if not candles or len(candles) < 2:
+        return False
+    spacing = (candles[-1]["date"] - candles[-2]["date"]).total_seconds()
+    age = time.time() - calendar.timegm(candles[-1]["date"].timetuple())
+    return age > 2 * spacing
+
+
+def live_days(interval):
+    """Days of intraday candles for live charts: one day, or less when Kraken's candle limit is shorter."""
+    return min(1, MAX_CANDLES * interval / (24 * 60))
+
+
+@cached(ttl=LIVE_TTL)
+def get_live_candles(pair, interval=5):
+    """
+    Last day of intraday candles for live charts. Cached briefly so every open
+    live chart shares one Kraken request per pair and interval.
+    """
+    return get_history(pair, interval=interval, days=live_days(interval))
@@ -0,0 +1,191 @@
+import calendar
+import json
+import os
+from urllib.parse import urlparse
+
+import streamlit as st
+import streamlit.components.v1 as components
+import plotly.graph_objects as go
+
+from students.kraken import live_days
+
+# Candle interval label -> Kraken interval in minutes
+LIVE_INTERVALS = {"1 min": 1, "5 min": 5, "15 min": 15, "1 hour": 60}
+POLL_SECONDS = 10
+MAX_POINTS = 720
+
+# The chart lives in a component iframe: it is drawn once, then polls the data
+# API for candles at or after the newest one it has. New candles are appended
+# with Plotly.extendTraces and the still-forming candle is updated in place, so
+# only changed candles cross the network and the page script never reruns.
+_TEMPLATE = """
+<div id="chart" style="width:100%;height:{height}px"></div>
+<div id="status" style="font:12px sans-serif;color:#8B7355"></div>
+<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
+<script>
+const API = {api};
+const COIN = {coin};
+const INTERVAL = {interval};
+const fig = {figure};
+const gd = document.getElementById("chart");
+const status = document.getElementById("status");
+let lastTs = {last_ts};
+let failures = 0;
+
+Plotly.newPlot(gd, fig.data, fig.layout, {{responsive: true, displayModeBar: false}});
+
+const toX = (ts) => new Date(ts * 1000).toISOString().slice(0, 19);
+
+async function poll() {{
+  try {{
+    const response = await fetch(`${{API}}/live/${{COIN}}?interval=${{INTERVAL}}&since=${{lastTs}}`);
+    if (!response.ok) throw new Error(`HTTP ${{response.status}}`);
+    const candles = await response.json();
+    failures = 0;
+    status.textContent = "";
+    const trace = gd.data[0];
+    const update = {{x: [[]], open: [[]], high: [[]], low: [[]], close: [[]]}};
+    let changed = false;
+    for (const [ts, o, h, l, c] of candles) {{
+      if (ts === lastTs) {{
+        const i = trace.x.length - 1;
+        if (trace.close[i] !== c || trace.high[i] !== h || trace.low[i] !== l) {{
+          trace.open[i] = o; trace.high[i] = h; trace.low[i] = l; trace.close[i] = c;
+          changed = true;
+        }}
+      }} else if (ts > lastTs) {{
+        update.x[0].push(toX(ts));
+        update.open[0].push(o); update.high[0].push(h); update.low[0].push(l); update.close[0].push(c);
+        lastTs = ts;
+      }}
+    }}
+    if (update.x[0].length) {{
+      Plotly.extendTraces(gd, update, [0], {max_points});
+    }} else if (changed) {{
+      Plotly.redraw(gd);
+    }}
+  }} catch (e) {{
+    // Keep the last drawn chart; the next poll will retry
+    if (++failures >= 3) {{
+      status.textContent = `Live updates paused: data API not reachable at ${{API}} (${{e.message}})`;
+    }}
+  }}
+}}
+
+setInterval(poll, {poll_ms});
+</script>
+"""
+
+
+def _viewer_origin():
+    """(scheme, hostname) the page was opened on, or None when Streamlit can't tell."""
+    headers = getattr(getattr(st, "context", None), "headers", None)
+    if not headers:
+        return None
+    origin = urlparse(headers.get("Origin") or f"http://{headers.get('Host', '')}")
+    return origin.scheme, origin.hostname
+
+
+def _viewer_is_local():
+    origin = _viewer_origin()
+    return origin is None or origin[1] in ("localhost", "127.0.0.1", "::1")
+
+
+def data_api_url():
+    """
+    Browser-reachable URL of the data API (app/api.py), or None if not configured.
+    DATA_API_PORT alone only works in local development: the browser resolves
+    localhost to the viewer's machine, so deployments must set DATA_API_URL.
+    """
+    url = os.environ.get("DATA_API_URL")
+    if url:
+        return url.rstrip("/")
+    port = os.environ.get("DATA_API_PORT")
+    return f"http://localhost:{port}" if port and _viewer_is_local() else None
+
+
+def plot_live_candlestick(data, symbol, interval_label, height=400):
+    # Plain lists (not numpy arrays) so the browser can append to them directly
+    fig = go.Figure(
+        data=[
+            go.Candlestick(
+                x=[c["date"].strftime("%Y-%m-%dT%H:%M:%S") for c in data],
+                open=[c["open"] for c in data],
+                high=[c["high"] for c in data],
+                low=[c["low"] for c in data],
+                close=[c["close"] for c in data],
+                increasing_line_color="#4CAF50",
+                decreasing_line_color="#EF5350",
+                whiskerwidth=0.7,
+                opacity=1
+            )
+        ]
+    )
+
+    fig.update_layout(
+        title=f"{symbol} Live {interval_label} Candlestick Chart (UTC)",
+        yaxis_title="Price (USD)",
+        template="plotly_white",
+        height=height,
+        margin=dict(l=20, r=20, t=40, b=20),
+        paper_bgcolor="#FAF8F3",
+        plot_bgcolor="#FFFFFF",
+        font=dict(color="#3A3A3A", size=10),
+        xaxis=dict(
+            type="date",
+            gridcolor="rgba(0,0,0,0.08)",
+            rangeslider=dict(visible=False),
+            showline=True,
+            linecolor="rgba(0,0,0,0.1)"
+        ),
+        yaxis=dict(
+            gridcolor="rgba(0,0,0,0.08)",
+            showline=True,
+            linecolor="rgba(0,0,0,0.1)",
+            tickprefix="$"
+        ),
+        hovermode="x unified",
+        showlegend=False
+    )
+    return fig
+
+
+def show_live_chart(data, coin, symbol, interval, interval_label, height=400):
+    fig = plot_live_candlestick(data, symbol, interval_label, height=height)
+    html = _TEMPLATE.format(
+        api=json.dumps(data_api_url()),
+        coin=json.dumps(coin),
+        interval=int(interval),
+        figure=fig.to_json(),
+        last_ts=calendar.timegm(data[-1]["date"].timetuple()),
+        max_points=MAX_POINTS,
+        poll_ms=POLL_SECONDS * 1000,
+        height=height,
+    )
+    components.html(html, height=height + 10)
+
+
+# Live section used by the coin pages in place of the daily chart
+def show_live_section(coin, pair, symbol, fetch, key):
+    api = data_api_url()
+    if not api:
+        if os.environ.get("DATA_API_PORT"):
+            st.info("Live updates need DATA_API_URL set to the data API's public address "
+                    "when the dashboard isn't opened on localhost.")
+        else:
+            st.info("Live updates need the data API. Set DATA_API_PORT (or DATA_API_URL) and restart the app.")
+        return
+
+    label = st.selectbox("Candle interval:", list(LIVE_INTERVALS), index=1, key=f"{key}_live_interval")
+    interval = LIVE_INTERVALS[label]
+    # Kraken serves at most 720 candles, e.g. 12 hours of 1-minute candles
+    days = live_days(interval)
+    data = fetch(pair, interval=interval, days=days)
+    if data:
+        show_live_chart(data, coin, symbol, interval, label)
+        window = "day" if days >= 1 else f"{days * 24:g} hours"
+        st.caption(f"Last {window}, updated every {POLL_SECONDS} seconds without reloading the page.")
+        if api.startswith("http://") and (_viewer_origin() or ("",))[0] == "https":
+            st.caption("⚠️ The data API URL uses http, so browsers block it on this https page.")
+    else:
+        st.error(f"Unable to load {symbol} live data.")
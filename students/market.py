@@ -0,0 +1,113 @@
+import threading
+
+import requests
+
+from students.cache import cached
+from students.registry import list_coins
+
+# Latest prices for every registered coin, fetched in one batched request per
+# refresh however many coins are registered
+PRICES_URL = "https://api.coingecko.com/api/v3/simple/price"
+TICKER_URL = "https://api.kraken.com/0/public/Ticker"
+ASSET_PAIRS_URL = "https://api.kraken.com/0/public/AssetPairs"
+MARKET_WAIT = 1.0  # seconds the ticker waits before falling back to snapshot prices
+
+_refresh = None
+_refreshed = None  # result of the last finished background request
+_refresh_lock = threading.Lock()
+
+
+def fetch_coingecko_prices(coins):
+    params = {
+        "ids": ",".join(coin["coingecko_id"] for coin in coins),
+        "vs_currencies": "usd",
+        "include_24hr_change": "true"
+    }
+    response = requests.get(PRICES_URL, params=params, timeout=5)
+    response.raise_for_status()
+    data = response.json()
+    return {
+        coin["slug"]: {
+            "price": data[coin["coingecko_id"]].get("usd", 0),
+            "change": data[coin["coingecko_id"]].get("usd_24h_change", 0)
+        }
+        for coin in coins if coin["coingecko_id"] in data
+    }
+
+
+@cached(ttl=24 * 60 * 60)
+def get_kraken_pair_keys(pairs):
+    """
+    Map requested pair names (e.g. XBTUSD) to the keys Kraken uses in
+    Ticker results (e.g. XXBTZUSD). Pair metadata rarely changes, so one
+    batched AssetPairs request per day covers every pair.
+    """
+    response = requests.get(ASSET_PAIRS_URL, params={"pair": ",".join(pairs)}, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+    if data.get("error"):
+        raise RuntimeError(", ".join(data["error"]))
+    keys = {}
+    for key, info in data["result"].items():
+        keys[info.get("altname", key)] = key
+    return keys
+
+
+def fetch_kraken_tickers(coins):
+    """Last price and change since today's open for all coins from one Ticker request."""
+    pairs = tuple(coin["kraken_pair"] for coin in coins)
+    response = requests.get(TICKER_URL, params={"pair": ",".join(pairs)}, timeout=5)
+    response.raise_for_status()
+    data = response.json()
+    if data.get("error"):
+        raise RuntimeError(", ".join(data["error"]))
+
+    result = data["result"]
+    keys = {} if all(pair in result for pair in pairs) else get_kraken_pair_keys(pairs)
+    market = {}
+    for coin in coins:
+        info = result.get(coin["kraken_pair"]) or result.get(keys.get(coin["kraken_pair"]))
+        if not info:
+            continue
+        price = float(info["c"][0])
+        opening = float(info["o"])
+        market[coin["slug"]] = {"price": price, "change": (price - opening) / opening * 100 if opening else 0}
+    return market
+
+
+@cached(ttl=60)
+def get_market_data():
+    """
+    {slug: {"price", "change"}} for every registered coin: CoinGecko (24h change)
+    first, then Kraken (change since today's open) if CoinGecko is unavailable.
+    """
+    coins = list_coins()
+    for fetch in (fetch_coingecko_prices, fetch_kraken_tickers):
+        try:
+            market = fetch(coins)
+            if market:
+                return market
+        except Exception:
+            continue
+    return None
+
+
+def _refresh_market_data():
+    global _refreshed
+    _refreshed = get_market_data()
+
+
+def peek_market_data(wait=MARKET_WAIT):
+    """
+    get_market_data(), but give up after `wait` seconds and return None while
+    the request carries on in the background (filling the cache for the next
+    run), so slow upstreams don't hold up the page.
+    """
+    global _refresh
+    with _refresh_lock:
+        if _refresh is None or not _refresh.is_alive():
+            _refresh = threading.Thread(target=_refresh_market_data, daemon=True)
+            _refresh.start()
+        refresh = _refresh
+    refresh.join(wait)
+    return None if refresh.is_alive() else _refreshed
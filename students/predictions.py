@@ -0,0 +1,69 @@
+import threading
+import time
+
+# Successful predictions are shared by the dashboard pages and the data API.
+# Error strings (e.g. "server is waking up") are not cached so a retry can succeed.
+PREDICTION_TTL = 600  # seconds
+
+_cache = {}
+_finished = {}  # coin -> (timestamp, result) of the last completed call, errors included
+_coin_locks = {}
+_lock = threading.Lock()
+
+
+def get_cached_prediction(coin, predict_fn, ttl=PREDICTION_TTL):
+    """
+    Return the prediction for `coin`, calling `predict_fn` only when there is
+    no successful result younger than `ttl` seconds. Concurrent callers for
+    the same coin share one upstream call and its result.
+    """
+    requested = time.time()
+    with _lock:
+        entry = _cache.get(coin)
+        coin_lock = _coin_locks.setdefault(coin, threading.Lock())
+    if entry and requested - entry[0] < ttl:
+        return entry[1]
+
+    with coin_lock:
+        # Another caller may have completed the call while we waited
+        with _lock:
+            entry = _cache.get(coin)
+            finished = _finished.get(coin)
+        if entry and time.time() - entry[0] < ttl:
+            return entry[1]
+        if finished and finished[0] >= requested:
+            return finished[1]
+
+        prediction = predict_fn()
+        now = time.time()
+        with _lock:
+            _finished[coin] = (now, prediction)
+            if isinstance(prediction, (int, float)):
+                _cache[coin] = (now, prediction)
+    return prediction
+
+
+def last_prediction(coin):
+    """Return (timestamp, value) of the last successful prediction, or None."""
+    with _lock:
+        return _cache.get(coin)
+
+
+def seed_predictions(predictions):
+    """
+    Load {coin: (timestamp, value)} from a startup snapshot. Seeded values are
+    only used when they are newer than what this process already has.
+    """
+    with _lock:
+        for coin, (ts, value) in predictions.items():
+            if coin not in _cache or _cache[coin][0] < ts:
+                _cache[coin] = (ts, value)
+
+
+def describe_last_prediction(coin):
+    """Caption for the last known prediction, shown when a live call fails."""
+    entry = last_prediction(coin)
+    if not entry:
+        return None
+    ts, value = entry
+    return f"Last known prediction: ${value:,.2f} USD (as of {time.strftime('%Y-%m-%d %H:%M', time.gmtime(ts))} UTC)"
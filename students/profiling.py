@@ -0,0 +1,163 @@
+import html
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+
+import streamlit as st
+
+# Opt-in statistical profiler for script runs.
+#   PROFILE_RERUNS=0.05  profile ~5% of runs (0 = only runs opened with ?profile=1)
+#   unset                profiling is off and start_profiler() returns immediately
+_SAMPLE_RATE = os.environ.get("PROFILE_RERUNS")
+PROFILE_DIR = os.environ.get(
+    "PROFILE_DIR",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "profiles")),
+)
+INTERVAL = float(os.environ.get("PROFILE_INTERVAL_MS", 5)) / 1000
+MAX_SECONDS = 120  # stop sampling even if the run never reached stop_profiler
+TOP_N = 25
+
+
+class Sampler(threading.Thread):
+    """Samples one thread's call stack every INTERVAL seconds."""
+
+    def __init__(self, thread_id):
+        super().__init__(name="profiler", daemon=True)
+        self.thread_id = thread_id
+        self.stacks = Counter()
+        self.samples = 0
+        self.started = time.perf_counter()
+        self.stopped = threading.Event()
+
+    def run(self):
+        deadline = self.started + MAX_SECONDS
+        while not self.stopped.wait(INTERVAL) and time.perf_counter() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                break
+            stack = []
+            while frame is not None:
+                stack.append(_label(frame))
+                frame = frame.f_back
+            self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        return time.perf_counter() - self.started
+
+
+def _label(frame):
+    code = frame.f_code
+    path = code.co_filename.replace("\\", "/").split("/")
+    return f"{code.co_name} ({'/'.join(path[-2:])}:{code.co_firstlineno})"
+
+
+def start_profiler():
+    """Start sampling the current script run if it was selected, else return None."""
+    if _SAMPLE_RATE is None:
+        return None
+    forced = st.query_params.get("profile") == "1"
+    if not forced and random.random() >= float(_SAMPLE_RATE or 0):
+        return None
+    sampler = Sampler(threading.get_ident())
+    sampler.start()
+    return sampler
+
+
+def stop_profiler(sampler, tag):
+    """Stop sampling and save the flame graph and summaries tagged with `tag`."""
+    if sampler is None:
+        return None
+    elapsed = sampler.stop()
+    if not sampler.samples:
+        return None
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    tag = "".join(ch if ch.isalnum() else "_" for ch in str(tag)).lower()
+    base = os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}_{tag}")
+    title = f"{tag}: {elapsed * 1000:.0f} ms, {sampler.samples} samples"
+
+    with open(base + ".folded", "w") as f:
+        for stack, count in sampler.stacks.most_common():
+            f.write(f"{';'.join(stack)} {count}\n")
+    with open(base + ".svg", "w") as f:
+        f.write(render_flamegraph(sampler.stacks, title))
+    with open(base + ".txt", "w") as f:
+        f.write(summarize(sampler.stacks, title, INTERVAL))
+    return base
+
+
+def summarize(stacks, title, interval):
+    """Top-N functions by self and by total (inclusive) samples."""
+    total = sum(stacks.values())
+    own = Counter()
+    inclusive = Counter()
+    for stack, count in stacks.items():
+        own[stack[-1]] += count
+        for name in set(stack):
+            inclusive[name] += count
+
+    lines = [title, ""]
+    for heading, counter in (("Self time", own), ("Total time", inclusive)):
+        lines.append(f"Top {TOP_N} by {heading.lower()}:")
+        for name, count in counter.most_common(TOP_N):
+            lines.append(f"  {count / total:6.1%}  {count * interval * 1000:8.0f} ms  {name}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def render_flamegraph(stacks, title, width=1200, row=17):
+    """Render folded stacks as a self-contained SVG flame graph (root at the bottom)."""
+    tree = {"children": {}, "count": 0}
+    for stack, count in stacks.items():
+        node = tree
+        node["count"] += count
+        for name in stack:
+            node = node["children"].setdefault(name, {"children": {}, "count": 0})
+            node["count"] += count
+
+    total = tree["count"]
+    rects = []
+    depth_max = [0]
+
+    def layout(node, x, depth):
+        depth_max[0] = max(depth_max[0], depth)
+        for name, child in sorted(node["children"].items()):
+            w = child["count"] / total * width
+            rects.append((name, x, depth, w, child["count"]))
+            layout(child, x, depth + 1)
+            x += w
+
+    layout(tree, 0.0, 0)
+    top = 30
+    height = top + (depth_max[0] + 1) * row + 10
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="Verdana, sans-serif" font-size="11">',
+        '<rect width="100%" height="100%" fill="#FAF8F3"/>',
+        f'<text x="{width / 2}" y="18" text-anchor="middle" font-size="14">{html.escape(title)}</text>',
+    ]
+    for name, x, depth, w, count in rects:
+        if w < 0.3:
+            continue
+        y = height - 10 - (depth + 1) * row
+        hue = zlib.crc32(name.encode()) % 40
+        label = html.escape(name)
+        out.append(
+            f'<g><title>{label} ({count} samples, {count / total:.1%})</title>'
+            f'<rect x="{x:.2f}" y="{y}" width="{w:.2f}" height="{row - 1}" rx="2" '
+            f'fill="hsl({hue + 10}, 85%, {55 + hue % 15}%)"/>'
+        )
+        chars = int(w / 7)
+        if chars >= 3:
+            text = label if len(name) <= chars else html.escape(name[:chars - 2]) + ".."
+            out.append(f'<text x="{x + 3:.2f}" y="{y + row - 5}">{text}</text>')
+        out.append("</g>")
+    out.append("</svg>")
+    return "\n".join(out)
@@ -0,0 +1,155 @@
+import importlib
+import json
+import os
+import time
+from datetime import date, timedelta
+from urllib.parse import urlparse
+
+import requests
+
+# Declarative list of supported coins (students/coins.json, or COIN_REGISTRY).
+# It drives the navigation, chart pages, prediction clients and market data.
+REGISTRY_PATH = os.environ.get(
+    "COIN_REGISTRY",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "coins.json")),
+)
+REQUIRED_FIELDS = ("slug", "name", "symbol", "kraken_pair", "coingecko_id", "icon")
+PREDICTOR_FIELDS = ("function", "url", "params", "result", "timeout", "retries", "health_url")
+
+_coins = None
+_predictors = {}
+
+
+def load_registry(path=None):
+    with open(path or REGISTRY_PATH) as f:
+        coins = json.load(f)
+
+    slugs = set()
+    for coin in coins:
+        if not isinstance(coin, dict):
+            raise ValueError(f"Coin registry entries must be objects, got: {coin!r}")
+        missing = [field for field in REQUIRED_FIELDS if not coin.get(field)]
+        if missing:
+            raise ValueError(f"Coin registry entry {coin.get('slug', coin)} is missing: {', '.join(missing)}")
+        if coin["slug"] in slugs:
+            raise ValueError(f"Duplicate coin slug in registry: {coin['slug']}")
+        slugs.add(coin["slug"])
+        coin.setdefault("chart_name", coin["name"])
+        coin.setdefault("color", None)
+        # A missing or null predictor means the coin has no prediction model
+        coin["predictor"] = coin.get("predictor") or {}
+        _validate_predictor(coin["slug"], coin["predictor"])
+    return coins
+
+
+def _validate_predictor(slug, spec):
+    def invalid(problem):
+        return ValueError(f"Coin registry entry {slug} has an invalid predictor: {problem}")
+
+    if not isinstance(spec, dict):
+        raise invalid(f"expected an object, got {spec!r}")
+    unknown = sorted(set(spec) - set(PREDICTOR_FIELDS))
+    if unknown:
+        raise invalid(f"unknown fields {', '.join(unknown)}")
+    if spec.get("function") and spec.get("url"):
+        raise invalid("set either function or url, not both")
+    if spec.get("function") and len(str(spec["function"]).split(":")) != 2:
+        raise invalid(f"function must look like 'module:name', got {spec['function']!r}")
+    for field in ("url", "health_url"):
+        if spec.get(field) and urlparse(str(spec[field])).scheme not in ("http", "https"):
+            raise invalid(f"{field} must be an http(s) URL, got {spec[field]!r}")
+    if spec.get("params") is not None and not isinstance(spec["params"], dict):
+        raise invalid("params must be an object")
+    if spec.get("result") is not None and not isinstance(spec["result"], str):
+        raise invalid("result must be a dotted path string")
+    timeout = spec.get("timeout")
+    if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0):
+        raise invalid("timeout must be a positive number")
+    retries = spec.get("retries")
+    if retries is not None and (isinstance(retries, bool) or not isinstance(retries, int) or retries < 1):
+        raise invalid("retries must be a positive integer")
+
+
+def list_coins():
+    global _coins
+    if _coins is None:
+        _coins = load_registry()
+    return _coins
+
+
+def get_coin(slug):
+    for coin in list_coins():
+        if coin["slug"] == slug:
+            return coin
+    raise KeyError(f"Unknown coin '{slug}'")
+
+
+def health_url(coin):
+    """URL the warm-up keeper pings for the coin's prediction backend, if it has one."""
+    spec = coin["predictor"]
+    if spec.get("health_url"):
+        return spec["health_url"]
+    if spec.get("url"):
+        parsed = urlparse(spec["url"])
+        return f"{parsed.scheme}://{parsed.netloc}/"
+    return None
+
+
+def get_predictor(coin):
+    """
+    Return the coin's prediction function. Either `predictor.function`
+    ("module:function", for backends that need custom handling) or a generic
+    client built from `predictor.url` / `params` / `result`.
+    """
+    slug = coin["slug"]
+    if slug not in _predictors:
+        spec = coin["predictor"]
+        if spec.get("function"):
+            module, name = spec["function"].split(":")
+            _predictors[slug] = getattr(importlib.import_module(module), name)
+        elif spec.get("url"):
+            _predictors[slug] = _endpoint_predictor(spec)
+        else:
+            _predictors[slug] = lambda: "No prediction model configured"
+    return _predictors[slug]
+
+
+def _endpoint_predictor(spec):
+    """
+    Generic prediction client. `url` may contain {yesterday} (YYYY/MM/DD);
+    `result` is a dotted path to the predicted high in the JSON response.
+    Rate-limited (429) and timed-out calls are retried up to `retries` times.
+    """
+    def predict():
+        yesterday = (date.today() - timedelta(days=1)).strftime("%Y/%m/%d")
+        url = spec["url"].format(yesterday=yesterday)
+        retries = spec.get("retries", 1)
+        for attempt in range(retries):
+            last_attempt = attempt == retries - 1
+            try:
+                response = requests.get(url, params=spec.get("params"), timeout=spec.get("timeout", 120))
+                data = response.json() if response.status_code == 200 else None
+                error = data.get("error") if isinstance(data, dict) else None
+                if response.status_code == 429 or (error and "429" in str(error)):
+                    if not last_attempt:
+                        time.sleep(5 * (attempt + 1))
+                        continue
+                    return "API busy (rate limit), please try again later"
+                if response.status_code != 200:
+                    return f"API Error: {response.status_code}"
+                if error:
+                    return f"API Error: {error}"
+                for part in spec.get("result", "predicted_next_day_high_usd").split("."):
+                    data = data.get(part) if isinstance(data, dict) else None
+                if data is None:
+                    return "No prediction available"
+                return float(data)
+            except requests.exceptions.Timeout:
+                if not last_attempt:
+                    time.sleep(3)
+                    continue
+                return "API timeout - server is waking up, please try again"
+            except Exception as e:
+                return f"Error: {e}"
+
+    return predict
@@ -0,0 +1,67 @@
+import gzip
+import json
+import os
+
+from students import store
+from students.predictions import seed_predictions
+
+# Compact snapshot of recent candles, ticker values and predictions baked into
+# the image at build time (see app/snapshot.py) so fresh containers start warm
+SNAPSHOT_PATH = os.environ.get(
+    "SNAPSHOT_PATH",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "snapshot.json.gz")),
+)
+
+_loaded = {}
+
+
+def write_snapshot(snapshot, path=None):
+    path = path or SNAPSHOT_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(snapshot, f, separators=(",", ":"))
+
+
+def read_snapshot(path=None):
+    path = path or SNAPSHOT_PATH
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_snapshot(path=None):
+    """
+    Seed the candle store and prediction cache from the snapshot, once per
+    process. Candles already in the store are kept; the normal incremental
+    Kraken fetch then catches up from the newest candle.
+    Returns the snapshot dict (or None when no snapshot was baked in).
+    """
+    path = path or SNAPSHOT_PATH
+    if path in _loaded:
+        return _loaded[path]
+
+    snapshot = read_snapshot(path)
+    if snapshot:
+        for pair, intervals in snapshot.get("candles", {}).items():
+            for interval, rows in intervals.items():
+                try:
+                    store.save_candles(pair, int(interval), rows, replace=False)
+                except Exception:
+                    break
+        seed_predictions({coin: tuple(entry) for coin, entry in snapshot.get("predictions", {}).items()})
+
+    _loaded[path] = snapshot
+    return snapshot
+
+
+def snapshot_ticker():
+    """
+    Return (market data, created timestamp) captured in the snapshot, or None.
+    Market data is {slug: {"price", "change"}} as of the image build.
+    """
+    snapshot = load_snapshot()
+    if not snapshot or not snapshot.get("ticker"):
+        return None
+    return snapshot["ticker"], snapshot.get("created", 0)
@@ -0,0 +1,103 @@
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+# Local candle store shared by the dashboard, the data API and the backfill tool
+STORE_PATH = os.environ.get(
+    "CANDLE_STORE_PATH",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "candles.sqlite")),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    pair TEXT NOT NULL,
+    interval INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume REAL,
+    PRIMARY KEY (pair, interval, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS checkpoints (
+    pair TEXT NOT NULL,
+    interval INTEGER NOT NULL,
+    since INTEGER NOT NULL,
+    PRIMARY KEY (pair, interval)
+);
+"""
+
+_initialized = set()
+
+
+def connect(path=None):
+    path = path or STORE_PATH
+    if path not in _initialized:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    if path not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _initialized.add(path)
+    return conn
+
+
+def save_candles(pair, interval, rows, path=None, replace=True):
+    """
+    Upsert raw Kraken OHLC rows ([time, open, high, low, close, vwap, volume, count]).
+    The newest candle is still forming, so existing rows are overwritten unless
+    `replace` is False (used when seeding older data that must not win).
+    """
+    if not rows:
+        return 0
+    values = [
+        (pair, interval, int(r[0]), float(r[1]), float(r[2]), float(r[3]), float(r[4]),
+         float(r[6]) if len(r) > 6 else None)
+        for r in rows
+    ]
+    with closing(connect(path)) as conn, conn:
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        conn.executemany(f"{verb} INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?)", values)
+    return len(values)
+
+
+def load_candles(pair, interval, since=0, path=None):
+    """Return stored candles newer than `since` in the dashboard's dict format."""
+    with closing(connect(path)) as conn:
+        cursor = conn.execute(
+            "SELECT ts, open, high, low, close FROM candles "
+            "WHERE pair = ? AND interval = ? AND ts >= ? ORDER BY ts",
+            (pair, interval, since),
+        )
+        return [
+            {"date": datetime.utcfromtimestamp(ts), "open": o, "high": h, "low": l, "close": c}
+            for ts, o, h, l, c in cursor
+        ]
+
+
+def coverage(pair, interval, path=None):
+    """Return (earliest, latest) stored candle timestamps, or (None, None)."""
+    with closing(connect(path)) as conn:
+        return conn.execute(
+            "SELECT MIN(ts), MAX(ts) FROM candles WHERE pair = ? AND interval = ?", (pair, interval)
+        ).fetchone()
+
+
+def get_checkpoint(pair, interval, path=None):
+    with closing(connect(path)) as conn:
+        row = conn.execute(
+            "SELECT since FROM checkpoints WHERE pair = ? AND interval = ?", (pair, interval)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def set_checkpoint(pair, interval, since, path=None):
+    with closing(connect(path)) as conn, conn:
+        conn.execute("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)", (pair, interval, int(since)))
+
+
+def clear_checkpoint(pair, interval, path=None):
+    with closing(connect(path)) as conn, conn:
+        conn.execute("DELETE FROM checkpoints WHERE pair = ? AND interval = ?", (pair, interval))
@@ -0,0 +1,150 @@
+import threading
+import time
+
+import requests
+
+from students.registry import list_coins, health_url
+
+# Free-tier prediction backends sleep when idle and take a while to spin up.
+# A background thread pings them ahead of use (app start, coin page opened)
+# and keeps recently used ones awake, learning how long each takes to wake.
+# Backends come from each coin's predictor in the registry (students/coins.json).
+PING_TIMEOUT = 150          # seconds; a cold start can take minutes
+COLD_LATENCY = 5.0          # a ping slower than this counts as a spin-up
+DEFAULT_SPINUP = 60.0       # spin-up estimate before any has been observed
+KEEP_WARM_FOR = 30 * 60     # keep pinging for this long after the last demand
+REPING_AFTER = 10 * 60      # hosts sleep after ~15 idle minutes
+LOOP_SECONDS = 30
+
+
+class Backend:
+    def __init__(self, coin, url):
+        self.coin = coin
+        self.url = url
+        self.status = "unknown"   # unknown | waking | ready | down
+        self.last_ok = 0.0
+        self.latency = None
+        self.spinup = None        # learned cold-start time (EWMA)
+        self.ping_started = None
+        self.demanded = 0.0
+
+    def expected_spinup(self):
+        return self.spinup if self.spinup is not None else DEFAULT_SPINUP
+
+
+class WarmupKeeper(threading.Thread):
+    def __init__(self, backends):
+        super().__init__(name="warmup", daemon=True)
+        self.backends = {coin: Backend(coin, url) for coin, url in backends.items()}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+
+    def request_warm(self, coin=None):
+        """Mark backends as about to be used (all when `coin` is None); never blocks."""
+        now = time.time()
+        with self.lock:
+            for backend in self.backends.values():
+                if coin is None or backend.coin == coin:
+                    backend.demanded = now
+        self.wakeup.set()
+
+    def run(self):
+        while True:
+            now = time.time()
+            with self.lock:
+                due = [
+                    b for b in self.backends.values()
+                    if b.ping_started is None
+                    and now - b.demanded < KEEP_WARM_FOR
+                    and (b.status != "ready" or now - b.last_ok > REPING_AFTER)
+                ]
+                for backend in due:
+                    backend.ping_started = now
+                    if backend.status != "ready":
+                        backend.status = "waking"
+            # One thread per ping so a slow cold start doesn't hold up the others
+            for backend in due:
+                threading.Thread(target=self._ping, args=(backend,), daemon=True).start()
+            self.wakeup.wait(LOOP_SECONDS)
+            self.wakeup.clear()
+
+    def _ping(self, backend):
+        t0 = time.time()
+        try:
+            # Any answer from the app (even 404/405) means it is awake;
+            # the platform proxy answers 502/503 while it is still starting
+            response = requests.get(backend.url, timeout=PING_TIMEOUT)
+            ok = response.status_code < 500
+        except Exception:
+            ok = False
+        latency = time.time() - t0
+
+        with self.lock:
+            backend.ping_started = None
+            if not ok:
+                backend.status = "down"
+                return
+            if latency > COLD_LATENCY:
+                backend.spinup = latency if backend.spinup is None else 0.7 * backend.spinup + 0.3 * latency
+            backend.status = "ready"
+            backend.last_ok = time.time()
+            backend.latency = latency
+
+    def record_prediction(self, coin, latency):
+        """A prediction just succeeded, so the backend is awake."""
+        with self.lock:
+            backend = self.backends.get(coin)
+            if backend is None:
+                return
+            backend.status = "ready"
+            backend.last_ok = time.time()
+            backend.latency = latency
+
+    def readiness(self, coin):
+        with self.lock:
+            b = self.backends.get(coin)
+            if b is None:
+                return "unknown", "⚪ No model server configured"
+            now = time.time()
+            if b.status == "ready" and now - b.last_ok < REPING_AFTER + LOOP_SECONDS:
+                return "ready", f"🟢 Model server ready ({b.latency:.1f} s response)"
+            if b.status == "waking" and b.ping_started:
+                remaining = max(0, b.expected_spinup() - (now - b.ping_started))
+                return "waking", f"🟡 Model server waking up (~{remaining:.0f} s left)"
+            if b.status == "down":
+                return "down", "🔴 Model server not responding - prediction may fail or be slow"
+            return "unknown", f"⚪ Model server may be asleep (wake-up takes ~{b.expected_spinup():.0f} s)"
+
+
+_keeper = None
+_keeper_lock = threading.Lock()
+
+
+def get_keeper():
+    global _keeper
+    with _keeper_lock:
+        if _keeper is None:
+            backends = {coin["slug"]: health_url(coin) for coin in list_coins() if health_url(coin)}
+            _keeper = WarmupKeeper(backends)
+            _keeper.start()
+        return _keeper
+
+
+def request_warm(coin=None):
+    get_keeper().request_warm(coin)
+
+
+def track_prediction(coin, predict_fn):
+    """Wrap `predict_fn` so a successful call marks the coin's backend as ready."""
+    def predict():
+        t0 = time.time()
+        prediction = predict_fn()
+        if isinstance(prediction, (int, float)):
+            get_keeper().record_prediction(coin, time.time() - t0)
+        return prediction
+    return predict
+
+
+def backend_status(coin):
+    """Readiness caption for the coin's prediction backend."""
+    return get_keeper().readiness(coin)[1]
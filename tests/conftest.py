@@ -0,0 +1,4 @@
+import sys, os
+
+# Allow the tests to find the students folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -0,0 +1,212 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from students import cache
+from students.cache import cached
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    cache.clear()
+    cache.set_budget(cache.CACHE_BUDGET_MB)
+    yield
+    cache.clear()
+    cache.set_budget(cache.CACHE_BUDGET_MB)
+
+
+def test_positional_and_keyword_calls_share_an_entry():
+    calls = []
+
+    @cached(ttl=60)
+    def add(a, b=1):
+        calls.append((a, b))
+        return a + b
+
+    assert add(1, 2) == 3
+    assert add(1, b=2) == 3
+    assert add(a=1, b=2) == 3
+    assert len(calls) == 1
+
+
+def test_unhashable_arguments_are_keyed_by_content():
+    calls = []
+
+    @cached(ttl=60)
+    def total(values, weights, frame):
+        calls.append(1)
+        return sum(values) + sum(weights.values()) + int(frame["x"].sum())
+
+    frame = pd.DataFrame({"x": [1, 2]})
+    assert total([1, 2], {"a": 3}, frame) == 9
+    assert total([1, 2], {"a": 3}, frame.copy()) == 9
+    assert total([1, 3], {"a": 3}, frame) == 10
+    assert len(calls) == 2
+
+
+def test_unkeyable_argument_raises_clear_error():
+    @cached(ttl=60)
+    def identity(value):
+        return value
+
+    with pytest.raises(TypeError, match="argument 'value'"):
+        identity({threading.Lock()})
+
+
+def test_callers_get_copies_unless_shared():
+    @cached(ttl=60)
+    def rows():
+        return [{"close": 1.0}]
+
+    @cached(ttl=60, copy=False)
+    def shared_rows():
+        return [{"close": 1.0}]
+
+    rows()[0]["close"] = 99.0
+    rows()[0]["close"] = 99.0
+    assert rows() == [{"close": 1.0}]
+    assert shared_rows() is shared_rows()
+
+
+def test_shared_entries_are_sized_by_measure():
+    import plotly.graph_objects as go
+
+    frame = pd.DataFrame({"close": [float(i) for i in range(10_000)], "pair": ["XBTUSD"] * 10_000})
+    figure = go.Figure(go.Scatter(x=list(range(5_000)), y=list(range(5_000))))
+
+    @cached(ttl=60, copy=False)
+    def shared(kind):
+        return frame if kind == "frame" else figure
+
+    assert shared("frame") is frame
+    frame_bytes = cache.cache_stats()["used_bytes"]
+    assert frame_bytes == frame.memory_usage(deep=True).sum()
+    assert frame_bytes > 10_000 * 8  # at least the float column
+
+    assert shared("figure") is figure
+    figure_bytes = cache.cache_stats()["used_bytes"] - frame_bytes
+    assert 2 * 5_000 * 2 < figure_bytes < 10 * 1024 * 1024
+
+    nested = {"rows": [{"close": 1.0}] * 3, "name": "x" * 1000}
+    assert cache.measure(nested) > 1000
+    assert cache.measure(nested) > cache.measure({"rows": [], "name": ""})
+
+
+def test_none_results_are_not_cached():
+    calls = []
+
+    @cached(ttl=60)
+    def flaky():
+        calls.append(1)
+        return None if len(calls) == 1 else "ok"
+
+    assert flaky() is None
+    assert flaky() == "ok"
+    assert flaky() == "ok"
+    assert len(calls) == 2
+
+
+def test_results_rejected_by_keep_are_not_cached():
+    calls = []
+
+    @cached(ttl=60, keep=lambda rows: rows[-1] != "stale")
+    def rows():
+        calls.append(1)
+        return ["stale"] if len(calls) == 1 else ["fresh"]
+
+    assert rows() == ["stale"]
+    assert rows() == ["fresh"]
+    assert rows() == ["fresh"]
+    assert len(calls) == 2
+
+
+def test_entries_expire_after_ttl():
+    calls = []
+
+    @cached(ttl=0.05)
+    def now():
+        calls.append(1)
+        return len(calls)
+
+    assert now() == 1
+    assert now() == 1
+    time.sleep(0.1)
+    assert now() == 2
+    assert cache.cache_stats()["expirations"] == 1
+
+
+def test_least_recently_used_entries_are_evicted_over_budget():
+    calls = []
+
+    @cached(ttl=60)
+    def blob(n):
+        calls.append(n)
+        return "x" * 40_000
+
+    cache.set_budget(0.1)  # ~105 KB: room for two 40 KB entries
+    blob(1)
+    blob(2)
+    blob(1)  # 1 is now more recent than 2
+    blob(3)  # evicts 2
+    assert calls == [1, 2, 3]
+    blob(1)
+    blob(2)
+    assert calls == [1, 2, 3, 2]
+    stats = cache.cache_stats()
+    assert stats["used_bytes"] <= stats["budget_bytes"]
+    assert stats["evictions"] == 2
+
+
+def test_entry_larger_than_budget_is_returned_but_not_stored():
+    @cached(ttl=60)
+    def huge():
+        return "x" * 200_000
+
+    cache.set_budget(0.1)
+    assert len(huge()) == 200_000
+    assert cache.cache_stats()["entries"] == 0
+
+
+def test_concurrent_misses_run_the_function_once():
+    calls = []
+    start = threading.Barrier(8)
+
+    @cached(ttl=60)
+    def slow(pair):
+        calls.append(pair)
+        time.sleep(0.2)
+        return [pair]
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(slow("XBTUSD"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert calls == ["XBTUSD"]
+    assert results == [["XBTUSD"]] * 8
+    assert not cache._key_locks
+
+
+def test_exceptions_release_the_key_lock():
+    calls = []
+
+    @cached(ttl=60)
+    def fails_once():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("upstream down")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        fails_once()
+    assert not cache._key_locks
+    assert fails_once() == "ok"
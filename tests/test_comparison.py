@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from students import comparison
+from students.comparison import compute_comparison, load_aligned_closes
+
+
+def _closes():
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2025-01-01", periods=60, freq="D")
+    prices = np.exp(np.cumsum(rng.normal(0, 0.03, size=(60, 3)), axis=0)) * [60000, 3000, 0.5]
+    closes = pd.DataFrame(prices, index=index, columns=["BTC", "ETH", "XRP"])
+    closes["USDT"] = 1.0  # constant price: zero return variance
+    return closes
+
+
+def test_rolling_correlations_match_pandas():
+    closes = _closes()
+    window = 7
+    normalized, corr, rolling = compute_comparison(closes, window)
+
+    returns = np.log(closes).diff().iloc[1:]
+    for name in rolling.columns:
+        a, b = name.split("/")
+        expected = returns[a].rolling(window).corr(returns[b]).iloc[window - 1:]
+        if "USDT" in name:
+            assert rolling[name].isna().all()
+        else:
+            np.testing.assert_allclose(rolling[name].to_numpy(), expected.to_numpy(), atol=1e-12)
+    assert list(rolling.index) == list(closes.index[window:])
+
+
+def test_normalized_prices_and_correlation_matrix():
+    closes = _closes()[["BTC", "ETH", "XRP"]]
+    normalized, corr, _ = compute_comparison(closes, 5)
+
+    assert (normalized.iloc[0] == 100).all()
+    np.testing.assert_allclose(normalized["ETH"], closes["ETH"] / closes["ETH"].iloc[0] * 100)
+    np.testing.assert_allclose(corr.to_numpy(), np.log(closes).diff().corr().to_numpy(), atol=1e-12)
+
+
+def test_failed_coin_is_skipped(monkeypatch):
+    dates = pd.date_range("2025-01-01", periods=5, freq="D")
+    histories = {
+        "XBTUSD": [{"date": d, "close": 100.0 + i} for i, d in enumerate(dates)],
+        "ETHUSD": None,
+        "XRPUSD": [{"date": d, "close": 1.0 + i} for i, d in enumerate(dates)],
+    }
+    monkeypatch.setattr(comparison, "get_coin_history_kraken", lambda pair, interval, days: histories[pair])
+    coins = [
+        {"name": "Bitcoin", "symbol": "BTC", "kraken_pair": "XBTUSD"},
+        {"name": "Ethereum", "symbol": "ETH", "kraken_pair": "ETHUSD"},
+        {"name": "XRP", "symbol": "XRP", "kraken_pair": "XRPUSD"},
+    ]
+
+    closes = load_aligned_closes(coins, 30)
+    assert list(closes.columns) == ["BTC", "XRP"]
+    assert len(closes) == 5
+    assert load_aligned_closes(coins[:2], 30) is None
@@ -0,0 +1,142 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+import requests
+
+from students import registry
+from students.registry import load_registry, health_url, _endpoint_predictor
+
+
+def _coin(**overrides):
+    coin = {
+        "slug": "bitcoin",
+        "name": "Bitcoin",
+        "symbol": "BTC",
+        "kraken_pair": "XBTUSD",
+        "coingecko_id": "bitcoin",
+        "icon": "https://example.com/btc.png",
+        "predictor": {"url": "https://model.example.com/predict"},
+    }
+    coin.update(overrides)
+    return coin
+
+
+def _load(tmp_path, coins):
+    path = tmp_path / "coins.json"
+    path.write_text(json.dumps(coins))
+    return load_registry(str(path))
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.data = data
+        self.status_code = status_code
+
+    def json(self):
+        return self.data
+
+
+def _serve(monkeypatch, *responses):
+    """Answer successive requests.get calls with `responses`; returns the recorded calls."""
+    calls = []
+    pending = list(responses)
+
+    def get(url, params=None, timeout=None):
+        calls.append({"url": url, "params": params, "timeout": timeout})
+        response = pending.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(registry.requests, "get", get)
+    monkeypatch.setattr(registry.time, "sleep", lambda seconds: None)
+    return calls
+
+
+def test_shipped_registry_uses_endpoint_predictors():
+    coins = load_registry()
+    assert [coin["slug"] for coin in coins] == ["bitcoin", "ethereum", "xrp", "solana"]
+    for coin in coins:
+        assert coin["predictor"]["url"].startswith("https://")
+        assert health_url(coin).endswith(".onrender.com/")
+
+
+def test_defaults_and_missing_predictor(tmp_path):
+    coins = _load(tmp_path, [_coin(), _coin(slug="eth", predictor=None), _coin(slug="sol", predictor={})])
+    assert coins[0]["chart_name"] == "Bitcoin"
+    assert health_url(coins[0]) == "https://model.example.com/"
+    assert coins[1]["predictor"] == {} and health_url(coins[1]) is None
+    assert coins[2]["predictor"] == {}
+
+
+@pytest.mark.parametrize("coins, message", [
+    ([_coin(symbol="")], "missing: symbol"),
+    ([_coin(), _coin()], "Duplicate coin slug"),
+    (["bitcoin"], "must be objects"),
+    ([_coin(predictor="https://x")], "expected an object"),
+    ([_coin(predictor={"url": "https://x", "colour": 1})], "unknown fields colour"),
+    ([_coin(predictor={"url": "https://x", "function": "a:b"})], "not both"),
+    ([_coin(predictor={"function": "students.bitcoin"})], "module:name"),
+    ([_coin(predictor={"url": "ftp://x"})], "http(s) URL"),
+    ([_coin(predictor={"url": "https://x", "params": [1]})], "params must be an object"),
+    ([_coin(predictor={"url": "https://x", "result": 1})], "dotted path"),
+    ([_coin(predictor={"url": "https://x", "timeout": 0})], "timeout must be a positive number"),
+    ([_coin(predictor={"url": "https://x", "retries": 0.5})], "retries must be a positive integer"),
+    ([_coin(predictor={"url": "https://x", "retries": True})], "retries must be a positive integer"),
+])
+def test_invalid_entries_are_rejected(tmp_path, coins, message):
+    with pytest.raises(ValueError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        _load(tmp_path, coins)
+
+
+def test_result_path_and_url_placeholders(monkeypatch):
+    calls = _serve(monkeypatch, FakeResponse({"prediction_summary": {"predicted_next_day_high_usd": 3120.5}}))
+    predict = _endpoint_predictor({
+        "url": "https://model.example.com/predict/eth/?date={yesterday}",
+        "params": {"close": 183.0},
+        "result": "prediction_summary.predicted_next_day_high_usd",
+        "timeout": 30,
+    })
+
+    assert predict() == 3120.5
+    yesterday = (date.today() - timedelta(days=1)).strftime("%Y/%m/%d")
+    assert calls == [{"url": f"https://model.example.com/predict/eth/?date={yesterday}",
+                      "params": {"close": 183.0}, "timeout": 30}]
+
+
+@pytest.mark.parametrize("data, expected", [
+    ({"predicted_next_day_high_usd": 67450}, 67450.0),   # default result path
+    ({"high": "0.512"}, 0.512),                           # numeric strings are converted
+    ({"predicted_next_day_high_usd": None}, "No prediction available"),
+    ({"other": 1}, "No prediction available"),
+    ([1, 2], "No prediction available"),
+    ({"error": "model not loaded"}, "API Error: model not loaded"),
+])
+def test_result_parsing(monkeypatch, data, expected):
+    _serve(monkeypatch, FakeResponse(data))
+    result = "high" if "high" in data else "predicted_next_day_high_usd"
+    assert _endpoint_predictor({"url": "https://x", "result": result})() == expected
+
+
+def test_http_errors_are_reported(monkeypatch):
+    _serve(monkeypatch, FakeResponse(None, status_code=503))
+    assert _endpoint_predictor({"url": "https://x"})() == "API Error: 503"
+
+
+def test_rate_limits_and_timeouts_are_retried(monkeypatch):
+    calls = _serve(
+        monkeypatch,
+        FakeResponse(None, status_code=429),
+        FakeResponse({"error": "429 Too Many Requests"}),
+        FakeResponse({"high": "1.5"}),
+    )
+    assert _endpoint_predictor({"url": "https://x", "result": "high", "retries": 3})() == 1.5
+    assert len(calls) == 3
+
+    _serve(monkeypatch, FakeResponse(None, status_code=429))
+    assert "rate limit" in _endpoint_predictor({"url": "https://x"})()
+
+    calls = _serve(monkeypatch, requests.exceptions.Timeout(), requests.exceptions.Timeout())
+    assert "timeout" in _endpoint_predictor({"url": "https://x", "retries": 2})()
+    assert len(calls) == 2